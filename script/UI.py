@@ -10,12 +10,11 @@ from datetime import datetime
 from PyQt6.QtCore import Qt, QTimer, QThreadPool, QSettings, QUrl, QThread, QMetaObject, Q_ARG
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, 
-    QLineEdit, QFileDialog, QMessageBox, QListWidget, QListWidgetItem,
+    QLineEdit, QFileDialog, QMessageBox, QListWidget,
     QProgressBar, QFrame, QSplitter, QSizePolicy, QGroupBox, QStatusBar,
     QProgressDialog, QCheckBox, QSlider, QDialog, QDialogButtonBox, QTextEdit
 )
-from PyQt6.QtGui import QPixmap, QDesktopServices, QPainter, QColor, QImage
-from wand.image import Image as WandImage
+from PyQt6.QtGui import QPixmap, QPixmapCache, QDesktopServices, QPainter, QColor, QImage
 import io
 from script.translations import t, LANGUAGES
 from script.styles import apply_style, apply_theme
@@ -26,12 +25,17 @@ from script.sponsor import SponsorDialog
 from script.menu import MenuManager
 from script.updates import UpdateChecker
 from script.version import __version__
-from script.workers import ImageComparisonWorker
+from script.workers import DeleteWorker, ImageComparisonWorker, ThumbnailWorker
+from script.update_preview import update_preview as update_preview_widgets
 from script.settings_dialog import SettingsDialog  
 from script.logger import logger
-from script.undo_manager import UndoManager, FileOperation
+from script.undo_manager import UndoManager
 from script.language_manager import LanguageManager  
 
+PREVIEW_CACHE_KB = 64 * 1024  # Memory kept for decoded preview thumbnails
+PREVIEW_DEBOUNCE_MS = 80  # Selection must settle this long before previews load
+BACKGROUND_DELETE_MIN_FILES = 100  # Selections this large are trashed on the thread pool
+
 class UI(QMainWindow):
     """Main UI class for Image Deduplicator."""
     
@@ -69,6 +73,13 @@ class UI(QMainWindow):
         self.thread_pool = QThreadPool()
         self.logger.debug(f"Thread pool initialized with max thread count: {self.thread_pool.maxThreadCount()}")
         
+        # Previews are decoded in the background and kept in Qt's pixmap cache
+        QPixmapCache.setCacheLimit(PREVIEW_CACHE_KB)
+        self.preview_dialog = None
+        self._pending_previews: Dict[str, str] = {}  # image path -> cache key
+        self._delete_worker = None
+        self._delete_progress = None
+        
         self.update_checker = UpdateChecker(__version__, language_manager=self.lang_manager)
         self.log_file = str(log_dir / "image_dedup.log")
         
@@ -218,6 +229,7 @@ class UI(QMainWindow):
         
         # Set minimum sizes
         self.duplicates_list.setMinimumHeight(400)  # Make the list taller to compensate for removed previews
+        self.duplicates_list.setUniformItemSizes(True)  # All rows are one line; skip per-row size hints
         
         # Initially hide progress bar
         self.progress_frame.hide()
@@ -235,8 +247,13 @@ class UI(QMainWindow):
         self.delete_selected_button.clicked.connect(self.delete_selected)
         self.delete_all_button.clicked.connect(self.delete_all_duplicates)
         
-        # List selection
-        self.duplicates_list.itemSelectionChanged.connect(self.update_preview)
+        # List selection; the preview follows after a short pause, so stepping
+        # through the list with the keyboard does not decode every row passed
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self.update_preview)
+        self.duplicates_list.itemSelectionChanged.connect(self._preview_timer.start)
         
         # Update button states
         self.duplicates_list.itemSelectionChanged.connect(self.update_button_states)
@@ -317,6 +334,7 @@ class UI(QMainWindow):
         
         if folder:
             self.folder_entry.setText(folder)
+            self.status_bar.showMessage(self.lang_manager.translate('folder_selected', folder=folder))
     
     def compare_images(self):
         """Start the image comparison process."""
@@ -342,7 +360,7 @@ class UI(QMainWindow):
         self.compare_button.setEnabled(False)
         
         # Show progress bar and status
-        self.status_label.setText(self.lang_manager.translate('comparing_images'))
+        self.progress_label.setText(self.lang_manager.translate('comparing_images'))
         self.progress_frame.show()
         
         # Create and start the worker thread
@@ -441,18 +459,38 @@ class UI(QMainWindow):
     def update_duplicates_list(self):
         """Update the duplicates list with the current duplicates."""
         self.duplicates_list.clear()
-        
+        base_folder = self.folder_entry.text()
+        # Worker results are absolute paths under the scanned folder, so the
+        # relative name is usually a plain slice; relpath is the fallback
+        base_prefix = os.path.join(os.path.abspath(base_folder), '') if base_folder else ''
+        
+        # Add all rows in one batch: no repaints, and the button states are
+        # refreshed once at the end instead of once per inserted row
+        model = self.duplicates_list.model()
+        model.rowsInserted.disconnect(self.update_button_states)
+        self.duplicates_list.setUpdatesEnabled(False)
         try:
             # The duplicates dictionary is now {original_path: [duplicate1_path, duplicate2_path, ...]}
+            display_names = []
+            path_pairs = []
             for original_path, dup_paths in self.duplicates.items():
                 for dup_path in dup_paths:
                     # Create a display name that shows the relative path from the search directory
-                    display_name = os.path.relpath(dup_path, self.folder_entry.text()) if self.folder_entry.text() else dup_path
-                    
-                    item = QListWidgetItem(display_name)
-                    # Store both original and duplicate paths in the item's data
-                    item.setData(Qt.ItemDataRole.UserRole, (original_path, dup_path))
-                    self.duplicates_list.addItem(item)
+                    if not base_folder:
+                        display_name = dup_path
+                    elif dup_path.startswith(base_prefix):
+                        display_name = dup_path[len(base_prefix):]
+                    else:
+                        display_name = os.path.relpath(dup_path, base_folder)
+                    display_names.append(display_name)
+                    path_pairs.append((original_path, dup_path))
+            
+            # One addItems call inserts every row at once, which is much
+            # cheaper than adding the items one by one
+            self.duplicates_list.addItems(display_names)
+            for row, pair in enumerate(path_pairs):
+                # Store both original and duplicate paths in the item's data
+                self.duplicates_list.item(row).setData(Qt.ItemDataRole.UserRole, pair)
             
             # Update status with total number of duplicates found (not the number of groups)
             total_duplicates = sum(len(dups) for dups in self.duplicates.values())
@@ -461,6 +499,10 @@ class UI(QMainWindow):
         except Exception as e:
             logger.error(f"Error updating duplicates list: {e}")
             self.status_bar.showMessage(self.lang_manager.translate('error_updating_list'))
+        finally:
+            self.duplicates_list.setUpdatesEnabled(True)
+            model.rowsInserted.connect(self.update_button_states)
+            self.update_button_states()
     
     def update_preview(self):
         """Handle selection changes in the duplicates list."""
@@ -469,74 +511,75 @@ class UI(QMainWindow):
             if not selected_items:
                 return
                 
-            item = selected_items[0]
-            item_data = item.data(Qt.ItemDataRole.UserRole)
-            
+            item_data = selected_items[0].data(Qt.ItemDataRole.UserRole)
             if not item_data or not isinstance(item_data, (list, tuple)) or len(item_data) < 2:
                 return
-                
-            original_path, duplicate_path = item_data[0], item_data[1]
-            if not all([original_path, duplicate_path]):
+            if not all(item_data[:2]):
                 return
                 
-            # Create or update preview dialog
-            if hasattr(self, 'preview_dialog'):
-                # Clear existing layout if it exists
-                if self.preview_dialog.layout():
-                    # Create a temporary widget to clear the layout
-                    temp_widget = QWidget()
-                    temp_widget.setLayout(self.preview_dialog.layout())
-                    temp_widget.deleteLater()
-            else:
-                self.preview_dialog = QDialog(self)
-                self.preview_dialog.setWindowTitle(self.lang_manager.translate('image_preview'))
-                self.preview_dialog.setModal(False)
-                self.preview_dialog.resize(900, 800)
-            
-            # Create main layout and set it on the dialog
-            main_layout = QVBoxLayout(self.preview_dialog)
-            
-            # Original image preview
-            original_group = QGroupBox(self.lang_manager.translate('original_image'))
-            original_layout = QVBoxLayout(original_group)  # Set layout directly on the group
-            self.original_preview = QLabel()
-            self.original_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.original_preview.setMinimumSize(400, 300)
-            self.original_preview.setStyleSheet("background-color: #2d2d2d; border: 1px solid #3a3a3a;")
-            self.original_path_label = QLabel()
-            self.original_path_label.setWordWrap(True)
-            original_layout.addWidget(self.original_preview, 1)
-            original_layout.addWidget(self.original_path_label)
-            
-            # Duplicate image preview
-            duplicate_group = QGroupBox(self.lang_manager.translate('duplicate_image'))
-            duplicate_layout = QVBoxLayout(duplicate_group)  # Set layout directly on the group
-            self.duplicate_preview = QLabel()
-            self.duplicate_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.duplicate_preview.setMinimumSize(400, 300)
-            self.duplicate_preview.setStyleSheet("background-color: #2d2d2d; border: 1px solid #3a3a3a;")
-            self.duplicate_path_label = QLabel()
-            self.duplicate_path_label.setWordWrap(True)
-            duplicate_layout.addWidget(self.duplicate_preview, 1)
-            duplicate_layout.addWidget(self.duplicate_path_label)
-            
-            # Add to main layout
-            main_layout.addWidget(original_group, 1)
-            main_layout.addWidget(duplicate_group, 1)
-            
-            # Close button
-            button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
-            button_box.rejected.connect(self.preview_dialog.reject)
-            main_layout.addWidget(button_box)
+            dialog = self._get_preview_dialog()
+            update_preview_widgets(
+                self, self.duplicates_list,
+                self.original_preview, self.duplicate_preview,
+                self.original_path_label, self.duplicate_path_label,
+                lang=self.lang
+            )
             
             # Show the dialog
-            self.preview_dialog.show()
-            self.preview_dialog.raise_()
+            dialog.show()
+            dialog.raise_()
             
         except Exception as e:
             logger.error(f"Error updating preview: {e}")
             self.status_bar.showMessage(self.lang_manager.translate('error_updating_preview'))
     
+    def _get_preview_dialog(self) -> QDialog:
+        """Return the preview dialog, creating it on first use."""
+        if self.preview_dialog is not None:
+            return self.preview_dialog
+            
+        self.preview_dialog = QDialog(self)
+        self.preview_dialog.setWindowTitle(self.lang_manager.translate('image_preview'))
+        self.preview_dialog.setModal(False)
+        self.preview_dialog.resize(900, 800)
+        
+        main_layout = QVBoxLayout(self.preview_dialog)
+        
+        # Original image preview
+        self.original_group = QGroupBox(self.lang_manager.translate('original_image'))
+        original_layout = QVBoxLayout(self.original_group)
+        self.original_preview = QLabel()
+        self.original_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.original_preview.setMinimumSize(400, 300)
+        self.original_preview.setStyleSheet("background-color: #2d2d2d; border: 1px solid #3a3a3a;")
+        self.original_path_label = QLabel()
+        self.original_path_label.setWordWrap(True)
+        original_layout.addWidget(self.original_preview, 1)
+        original_layout.addWidget(self.original_path_label)
+        
+        # Duplicate image preview
+        self.duplicate_group = QGroupBox(self.lang_manager.translate('duplicate_image'))
+        duplicate_layout = QVBoxLayout(self.duplicate_group)
+        self.duplicate_preview = QLabel()
+        self.duplicate_preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.duplicate_preview.setMinimumSize(400, 300)
+        self.duplicate_preview.setStyleSheet("background-color: #2d2d2d; border: 1px solid #3a3a3a;")
+        self.duplicate_path_label = QLabel()
+        self.duplicate_path_label.setWordWrap(True)
+        duplicate_layout.addWidget(self.duplicate_preview, 1)
+        duplicate_layout.addWidget(self.duplicate_path_label)
+        
+        # Add to main layout
+        main_layout.addWidget(self.original_group, 1)
+        main_layout.addWidget(self.duplicate_group, 1)
+        
+        # Close button
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        button_box.rejected.connect(self.preview_dialog.reject)
+        main_layout.addWidget(button_box)
+        
+        return self.preview_dialog
+    
     def select_all_duplicates(self):
         """Select all items in the duplicates list."""
         self.duplicates_list.selectAll()
@@ -577,29 +620,30 @@ class UI(QMainWindow):
         if confirm != QMessageBox.StandardButton.Yes:
             return
 
-        # Process deletions with undo support
+        # Large selections are trashed in the background like "delete all"
+        if len(selected_paths) >= BACKGROUND_DELETE_MIN_FILES:
+            self._start_delete_worker(selected_paths)
+            return
+
+        # Process deletions with undo support; move_to_trash records the undo operation
+        deleted = []
         failed_deletions = []
         
-        for i, file_path in enumerate(selected_paths):
+        for item, file_path in zip(selected_items, selected_paths):
             try:
-                # Move to trash using send2trash
-                trash_path = self.undo_manager.move_to_trash(file_path)
-                
-                # Create an operation for undo
-                operation = FileOperation(
-                    operation_type='delete',
-                    source=file_path,  # Store original path for undo
-                    metadata={'original_path': file_path}
-                )
-                self.undo_manager.add_operation(operation)
+                self.undo_manager.move_to_trash(file_path)
+                deleted.append(file_path)
                 
                 # Update UI
-                self.duplicates_list.takeItem(self.duplicates_list.row(selected_items[i]))
+                self.duplicates_list.takeItem(self.duplicates_list.row(item))
                 
             except Exception as e:
                 self.logger.error(f"Failed to move {file_path} to trash: {e}", exc_info=True)
                 failed_deletions.append(file_path)
         
+        # The remaining results stay valid, so drop the deleted files instead of rescanning
+        self._forget_deleted_duplicates(deleted)
+        
         # Show result message
         if failed_deletions:
             QMessageBox.warning(
@@ -649,66 +693,39 @@ class UI(QMainWindow):
         if confirm != QMessageBox.StandardButton.Yes:
             return
 
-        # Process deletions with undo support
-        failed_deletions = []
-        deleted_count = 0
+        self._start_delete_worker([dup for dups in self.duplicates.values() for dup in dups])
+    
+    def _start_delete_worker(self, file_paths):
+        """Move files to the trash on the thread pool behind a progress dialog."""
+        # Disable UI during operation
+        self.set_ui_enabled(False)
         
-        try:
-            # Disable UI during operation
-            self.set_ui_enabled(False)
-            
-            # Create progress dialog
-            progress = QProgressDialog(
-                self.lang_manager.translate('deleting_duplicates', count=total_duplicates),
-                self.lang_manager.translate('cancel'),
-                0, total_duplicates, self
-            )
-            progress.setWindowModality(Qt.WindowModality.WindowModal)
-            progress.setWindowTitle(self.lang_manager.translate('deleting'))
-            progress.setValue(0)
-            progress.show()
-            
-            # Process each original and its duplicates
-            for original, duplicates in self.duplicates.items():
-                for duplicate in duplicates:
-                    if progress.wasCanceled():
-                        break
-                        
-                    try:
-                        # Move to trash using send2trash
-                        self.undo_manager.move_to_trash(duplicate)
-                        
-                        # Create an operation for undo
-                        operation = FileOperation(
-                            operation_type='delete',
-                            source=duplicate,  # Store original path for undo
-                            metadata={'original_path': duplicate}
-                        )
-                        self.undo_manager.add_operation(operation)
-                        
-                        deleted_count += 1
-                        progress.setValue(deleted_count)
-                        QApplication.processEvents()
-                        
-                    except Exception as e:
-                        self.logger.error(f"Failed to move {duplicate} to trash: {e}", exc_info=True)
-                        failed_deletions.append(duplicate)
-                
-                if progress.wasCanceled():
-                    break
-                    
-        except Exception as e:
-            self.logger.error(f"Error during bulk delete: {e}", exc_info=True)
-            QMessageBox.critical(
-                self,
-                self.lang_manager.translate('error'),
-                self.lang_manager.translate('error_during_bulk_delete', error=str(e))
-            )
-            return
-            
-        finally:
-            progress.close()
-            self.set_ui_enabled(True)
+        # Create progress dialog
+        self._delete_progress = QProgressDialog(
+            self.lang_manager.translate('deleting_duplicates', count=len(file_paths)),
+            self.lang_manager.translate('cancel'),
+            0, len(file_paths), self
+        )
+        self._delete_progress.setWindowModality(Qt.WindowModality.WindowModal)
+        self._delete_progress.setWindowTitle(self.lang_manager.translate('deleting'))
+        self._delete_progress.setValue(0)
+        
+        # Trash the files on the thread pool so the UI keeps repainting;
+        # failures are collected and reported once at the end
+        self._delete_worker = DeleteWorker(file_paths, self.undo_manager)
+        self._delete_worker.signals.progress.connect(self._delete_progress.setValue)
+        self._delete_worker.signals.finished.connect(self._on_delete_finished)
+        self._delete_progress.canceled.connect(self._delete_worker.stop)
+        self._delete_progress.show()
+        self.thread_pool.start(self._delete_worker)
+    
+    def _on_delete_finished(self, deleted, failed_deletions):
+        """Report the result of a background delete and drop the deleted files from the list."""
+        self._delete_progress.close()
+        self._delete_progress = None
+        self._delete_worker = None
+        self.set_ui_enabled(True)
+        deleted_count = len(deleted)
         
         # Show result message
         if failed_deletions:
@@ -726,21 +743,34 @@ class UI(QMainWindow):
                 self.lang_manager.translate('moved_to_trash', count=deleted_count)
             )
             
-        # Update UI
-        self.duplicates = {}
-        self.duplicates_list.clear()
+        # Keep only the duplicates that are still on disk (failed or cancelled)
+        self._forget_deleted_duplicates(deleted)
+        self.update_duplicates_list()
         
         # Clear the preview dialog if it exists
-        if hasattr(self, 'preview_dialog') and self.preview_dialog:
+        if self.preview_dialog:
             self.preview_dialog.close()
             self.preview_dialog = None
             
         self.update_button_states()
     
+    def _forget_deleted_duplicates(self, deleted):
+        """Remove deleted files from the comparison results."""
+        deleted = set(deleted)
+        if not deleted:
+            return
+        remaining = {}
+        for original, duplicates in self.duplicates.items():
+            kept = [dup for dup in duplicates if dup not in deleted]
+            if kept:
+                remaining[original] = kept
+        self.duplicates = remaining
+    
     def update_button_states(self):
         """Update the state of the action buttons based on the current selection."""
         has_items = self.duplicates_list.count() > 0
-        has_selection = len(self.duplicates_list.selectedItems()) > 0
+        # hasSelection() avoids wrapping every selected item just to count them
+        has_selection = self.duplicates_list.selectionModel().hasSelection()
         
         self.select_all_button.setEnabled(has_items)
         self.select_none_button.setEnabled(has_items)
@@ -1396,108 +1426,71 @@ class UI(QMainWindow):
 
     def load_image_preview(self, image_path, preview_widget, path_label):
         """
-        Load and display an image preview in the specified widget with enhanced error handling.
+        Show an image preview in the specified widget.
+        
+        Cached previews are shown immediately; otherwise the image is decoded
+        on the thread pool and shown once it is ready, so selecting an item
+        never blocks the UI on a full-resolution decode.
         
         Args:
             image_path: Path to the image file
             preview_widget: QLabel widget to display the image
             path_label: QLabel widget to display the path
         """
+        image_path = str(image_path)
+        path_label.setText(image_path)
+        # Remember what this widget should show; late results for other paths are ignored
+        preview_widget.setProperty('preview_path', image_path)
+        
         try:
-            self.logger.debug(f"Loading image preview for: {image_path}")
-            
-            # Validate input parameters
-            if not all([image_path, preview_widget, path_label]):
-                raise ValueError("Missing required parameters for image preview")
-                
-            # Convert to Path object if it's a string
-            if isinstance(image_path, str):
-                image_path = Path(image_path)
-            
-            # Check if file exists and is accessible
-            if not image_path.exists():
-                raise FileNotFoundError(f"Image file not found: {image_path}")
-            if not os.access(image_path, os.R_OK):
-                raise PermissionError(f"No read permission for file: {image_path}")
-                
-            # Log basic file info
-            file_size = image_path.stat().st_size / (1024 * 1024)  # Size in MB
-            self.logger.debug(f"Previewing image: {image_path.name} ({file_size:.2f} MB)")
-            
-            # Load the image with Wand
-            try:
-                with WandImage(filename=str(image_path)) as img:
-                    # Convert to RGB if necessary (for PNG with alpha channel)
-                    if img.alpha_channel:
-                        img.background_color = 'white'
-                        img.alpha_channel = 'remove'
-                    
-                    # Resize for preview while maintaining aspect ratio
-                    img.transform(resize=f"{preview_widget.width()}x{preview_widget.height()}>")
-                    
-                    # Convert to RGB and get raw image data
-                    img.format = 'rgb'
-                    img.depth = 8
-                    
-                    # Create QImage from raw RGB data
-                    width, height = img.size
-                    qimg = QImage(
-                        img.make_blob('RGB'),
-                        width,
-                        height,
-                        width * 3,  # Bytes per line (3 channels)
-                        QImage.Format.Format_RGB888
-                    )
-                    
-                    if qimg.isNull():
-                        raise ValueError("Failed to create QImage from image data")
-                    
-                    # Create and set pixmap
-                    pixmap = QPixmap.fromImage(qimg)
-                    if pixmap.isNull():
-                        raise ValueError("Failed to create QPixmap from QImage")
-                    
-                    # Scale the pixmap to fit the preview widget while maintaining aspect ratio
-                    scaled_pixmap = pixmap.scaled(
-                        preview_widget.size(),
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    
-                    preview_widget.setPixmap(scaled_pixmap)
-                    preview_widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                    path_label.setText(str(image_path))
-                    self.logger.debug(f"Successfully loaded preview for {image_path.name}")
-                        
-            except (IOError, ValueError, Exception) as img_error:
-                self.logger.error(f"Error loading image {image_path}: {img_error}", exc_info=True)
-                raise RuntimeError(f"Unsupported or corrupted image: {image_path.name}") from img_error
-                
-        except FileNotFoundError as e:
-            error_msg = f"File not found: {e}"
-            self.logger.error(error_msg)
-            if hasattr(path_label, 'setText'):
-                path_label.setText(error_msg)
-            if hasattr(preview_widget, 'clear'):
-                preview_widget.clear()
-            
-        except PermissionError as e:
-            error_msg = f"Permission denied: {e}"
-            self.logger.error(error_msg)
-            if hasattr(path_label, 'setText'):
-                path_label.setText(error_msg)
-            
-        except Exception as e:
-            error_msg = f"Error loading preview: {str(e)}"
-            self.logger.error(error_msg, exc_info=True)
-            if hasattr(path_label, 'setText'):
-                path_label.setText("Error: Could not load preview")
-                
-            # Clear the preview widget
-            if hasattr(preview_widget, 'clear'):
-                preview_widget.clear()
-            elif hasattr(preview_widget, 'setText'):
-                preview_widget.setText("Preview not available")
+            stat = os.stat(image_path)
+        except OSError as e:
+            self.logger.error(f"Cannot preview {image_path}: {e}")
+            preview_widget.clear()
+            preview_widget.setText(self.lang_manager.translate('preview_not_available'))
+            return
+        
+        # Keyed on mtime and size so a changed file is decoded again
+        cache_key = f"preview:{image_path}:{stat.st_mtime_ns}:{stat.st_size}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is not None and not pixmap.isNull():
+            self._set_preview_pixmap(preview_widget, pixmap)
+            return
+        
+        preview_widget.clear()
+        preview_widget.setText(self.lang_manager.translate('loading_preview'))
+        
+        if image_path not in self._pending_previews:
+            self._pending_previews[image_path] = cache_key
+            worker = ThumbnailWorker(image_path)
+            worker.signals.finished.connect(self._on_preview_loaded)
+            self.thread_pool.start(worker)
+    
+    def _on_preview_loaded(self, image_path: str, image: QImage):
+        """Cache a decoded preview and show it if it is still wanted."""
+        cache_key = self._pending_previews.pop(image_path, None)
+        
+        pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+        if cache_key and not pixmap.isNull():
+            QPixmapCache.insert(cache_key, pixmap)
+        
+        if self.preview_dialog is None:
+            return
+        for widget in (self.original_preview, self.duplicate_preview):
+            if widget.property('preview_path') != image_path:
+                continue
+            if pixmap.isNull():
+                widget.setText(self.lang_manager.translate('preview_not_available'))
+            else:
+                self._set_preview_pixmap(widget, pixmap)
+    
+    def _set_preview_pixmap(self, preview_widget, pixmap: QPixmap):
+        """Scale a pixmap to fit the preview widget and display it."""
+        preview_widget.setPixmap(pixmap.scaled(
+            preview_widget.size(),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        ))
 
     def get_theme_stylesheet(self):
         """Return the stylesheet for the current theme."""
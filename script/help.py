@@ -65,6 +65,10 @@ class HelpDialog(QDialog):
         self.lang = lang_code
         self.retranslate_ui()
         
+        # Re-apply search if there was one
+        if hasattr(self, 'last_search') and self.last_search:
+            self.perform_search()
+        
     def retranslate_ui(self):
         """Retranslate the UI elements."""
         self.setWindowTitle(self.translate('help'))
@@ -72,6 +76,11 @@ class HelpDialog(QDialog):
         self.tabs.setTabText(1, self.translate('help_features'))
         self.tabs.setTabText(2, self.translate('help_tips'))
         
+        # Update language selection
+        self.lang_label.setText(self.translate('language') + ":")
+        self.english_button.setChecked(self.lang == 'en')
+        self.italian_button.setChecked(self.lang == 'it')
+        
         # Update buttons
         self.close_button.setText(self.translate('help_close'))
         
@@ -87,6 +96,23 @@ class HelpDialog(QDialog):
         self.setup_features_tab()
         self.setup_tips_tab()
     
+    def _set_tab_content(self, tab, scroll):
+        """Show a scroll area in a tab, replacing any previous content.
+        
+        A widget keeps the first layout it is given, so when the tabs are
+        rebuilt the old scroll area is swapped out inside that layout.
+        """
+        layout = tab.layout()
+        if layout is None:
+            layout = QVBoxLayout(tab)
+            layout.setContentsMargins(0, 0, 0, 0)
+        while layout.count():
+            old = layout.takeAt(0).widget()
+            if old is not None:
+                old.setParent(None)
+                old.deleteLater()
+        layout.addWidget(scroll)
+    
     def setup_ui(self):
         """Set up the user interface."""
         # Main layout
@@ -679,13 +705,8 @@ class HelpDialog(QDialog):
         # Set the content widget as the scroll area's widget
         scroll.setWidget(content_widget)
         
-        # Create a layout for the tab and add the scroll area
-        tab_layout = QVBoxLayout()
-        tab_layout.addWidget(scroll)
-        tab_layout.setContentsMargins(0, 0, 0, 0)
-        
-        # Set the layout on the tab widget
-        self.usage_tab.setLayout(tab_layout)
+        # Show the scroll area in the tab
+        self._set_tab_content(self.usage_tab, scroll)
     
     def setup_features_tab(self):
         """Setup the features tab content."""
@@ -831,11 +852,8 @@ class HelpDialog(QDialog):
         # Set content widget and scroll area
         scroll.setWidget(content_widget)
         
-        # Create layout for features tab and set it
-        layout = QVBoxLayout()
-        layout.addWidget(scroll)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.features_tab.setLayout(layout)
+        # Show the scroll area in the features tab
+        self._set_tab_content(self.features_tab, scroll)
     
     def setup_tips_tab(self):
         """Setup the tips tab content."""
@@ -946,52 +964,18 @@ class HelpDialog(QDialog):
         # Set content widget and scroll area
         scroll.setWidget(content_widget)
         
-        # Create layout for tips tab and set it
-        layout = QVBoxLayout()
-        layout.addWidget(scroll)
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.tips_tab.setLayout(layout)
+        # Show the scroll area in the tips tab
+        self._set_tab_content(self.tips_tab, scroll)
     
     def change_language(self, lang_code):
         """Change the UI language."""
         if lang_code == self.lang:
             return  # No change needed
-            
-        self.lang_manager.set_language(lang_code)
-        self.lang = lang_code
-        
-        # Update button states
-        self.english_button.setChecked(lang_code == 'en')
-        self.italian_button.setChecked(lang_code == 'it')
-        
-        # Update UI
-        self.retranslate_ui()
         
-        # Update search options menu
-        self.search_options_button.setMenu(self.create_search_options_menu())
-        
-        # Update search input placeholder
-        self.search_input.setPlaceholderText(self.translate('search_help'))
-        
-        # Update close button text
-        self.close_button.setText(self.translate('help_close'))
-        
-        # Update tab names
-        self.tabs.setTabText(0, self.translate('usage'))
-        self.tabs.setTabText(1, self.translate('help_features'))
-        self.tabs.setTabText(2, self.translate('help_tips'))
-        
-        # Update language label
-        self.lang_label.setText(self.translate('language') + ":")
-        
-        # Update tab contents
-        self.setup_usage_tab()
-        self.setup_features_tab()
-        self.setup_tips_tab()
-        
-        # Re-apply search if there was one
-        if hasattr(self, 'last_search') and self.last_search:
-            self.perform_search()
+        # The language manager's signal retranslates the dialog once; call
+        # the handler directly if the manager was already in this language
+        if not self.lang_manager.set_language(lang_code):
+            self.on_language_changed(lang_code)
     
     def get_usage_content(self):
         """Get the original content for the usage tab."""
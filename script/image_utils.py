@@ -0,0 +1,204 @@
+"""
+Image helper functions for Image Deduplicator.
+
+These helpers are free of any Qt dependency so they can be used from
+worker threads as well as from the UI.
+"""
+from typing import Tuple
+
+import numpy as np
+from PIL import Image
+from scipy.fftpack import dct
+
+# Images whose pixels have a smaller standard deviation than this are treated
+# as flat, since any correlation between them would be measuring noise
+FLAT_IMAGE_STD = 2.0
+
+
+def compare_image_quality(img1: Image.Image, img2: Image.Image) -> float:
+    """Compare two images by the correlation of their pixels.
+
+    Each colour channel is centred on its mean before correlating, and the
+    score is the squared correlation: the share of pixel variation the two
+    images have in common. Unrelated images score near 0 however close
+    their overall colours are, while re-encoded, resized or slightly
+    brightened copies score close to 1. Flat images have no structure to
+    correlate and are compared by their mean colour instead.
+
+    Args:
+        img1: First PIL image
+        img2: Second PIL image
+
+    Returns:
+        float: Similarity between 0.0 (unrelated or inverted) and 1.0 (identical)
+    """
+    if img1.mode != 'RGB':
+        img1 = img1.convert('RGB')
+    if img2.mode != 'RGB':
+        img2 = img2.convert('RGB')
+
+    # Bring both images to the same size before comparing
+    if img1.size != img2.size:
+        img1 = img1.resize(img2.size, Image.Resampling.BILINEAR)
+
+    a = np.asarray(img1, dtype=np.float64).reshape(-1, 3)
+    b = np.asarray(img2, dtype=np.float64).reshape(-1, 3)
+    a_mean, b_mean = a.mean(axis=0), b.mean(axis=0)
+    a = a - a_mean
+    b = b - b_mean
+    a_norm = np.sqrt(np.sum(a * a))
+    b_norm = np.sqrt(np.sum(b * b))
+
+    # Below this norm the pixels vary by less than FLAT_IMAGE_STD levels
+    flat_norm = FLAT_IMAGE_STD * np.sqrt(a.size)
+    if a_norm <= flat_norm and b_norm <= flat_norm:
+        return 1.0 - float(np.max(np.abs(a_mean - b_mean))) / 255.0
+    if a_norm <= flat_norm or b_norm <= flat_norm:
+        return 0.0  # Only one of the images has any structure
+
+    correlation = float(np.sum(a * b) / (a_norm * b_norm))
+    return max(0.0, correlation) ** 2
+
+
+def grayscale_thumbnail(img: Image.Image, size: int = 32) -> Image.Image:
+    """Reduce an image to a small single-channel thumbnail for hashing.
+
+    The perceptual hashes all start by converting to luma and shrinking the
+    image, so doing it once here lets every hash reuse the same thumbnail
+    instead of resampling the full-resolution image again.
+
+    Args:
+        img: Source PIL image
+        size: Width and height of the thumbnail in pixels
+
+    Returns:
+        Image.Image: A `size` x `size` image in 'L' mode
+    """
+    if img.mode != 'L':
+        img = img.convert('L')
+    # A box filter just averages the source pixels under each target pixel,
+    # which is all a hash needs and about twice as fast as bilinear on
+    # full-size images that could not be draft-decoded
+    return img.resize((size, size), Image.Resampling.BOX)
+
+
+def load_hash_thumbnail(path: str, size: int = 32) -> Image.Image:
+    """Decode an image file straight into a grayscale hashing thumbnail.
+
+    JPEG files are decoded with `Image.draft`, so libjpeg only produces
+    luma at a fraction of the full resolution; other formats ignore the
+    draft request and are decoded normally.
+
+    Args:
+        path: Path to the image file
+        size: Width and height of the thumbnail in pixels
+
+    Returns:
+        Image.Image: A `size` x `size` image in 'L' mode
+    """
+    with Image.open(path) as img:
+        # Ask for twice the target size so the final resize still has detail
+        img.draft('L', (size * 2, size * 2))
+        return grayscale_thumbnail(img, size)
+
+
+def load_comparison_image(path: str, size: int = 128) -> Image.Image:
+    """Decode an image file into a small fixed-size RGB image for pixel comparison.
+
+    Args:
+        path: Path to the image file
+        size: Width and height of the result in pixels
+
+    Returns:
+        Image.Image: A `size` x `size` image in 'RGB' mode
+    """
+    with Image.open(path) as img:
+        img.draft('RGB', (size * 2, size * 2))
+        return img.convert('RGB').resize((size, size), Image.Resampling.BILINEAR)
+
+
+def _bits_to_int(bits: np.ndarray) -> int:
+    """Pack a boolean array, row by row with the first bit highest, into an integer."""
+    return int.from_bytes(np.packbits(bits.ravel()).tobytes(), 'big') >> (-bits.size % 8)
+
+
+def perceptual_hash(img: Image.Image, hash_size: int = 8) -> int:
+    """Compute the perceptual hash of an image as an integer.
+
+    Gives the same bits as `imagehash.phash`, but the second DCT pass only
+    runs over the rows that end up in the hash, and the result is packed
+    straight into an int instead of going through an `ImageHash` and hex.
+
+    Args:
+        img: Source PIL image, ideally a thumbnail from `grayscale_thumbnail`
+        hash_size: Width and height of the hash in bits
+
+    Returns:
+        int: The hash, with the first bit as the most significant
+    """
+    img_size = hash_size * 4
+    if img.mode != 'L':
+        img = img.convert('L')
+    if img.size != (img_size, img_size):
+        img = img.resize((img_size, img_size), Image.Resampling.LANCZOS)
+    # Same transform as imagehash, so coefficients that are zero up to
+    # rounding compare against the median exactly as they do there
+    rows = dct(np.asarray(img), axis=0)[:hash_size]
+    low = dct(rows, axis=1)[:, :hash_size]
+    return _bits_to_int(low > np.median(low))
+
+
+def difference_hash(img: Image.Image, hash_size: int = 8) -> int:
+    """Compute the difference hash of an image as an integer.
+
+    Gives the same bits as `imagehash.dhash`.
+
+    Args:
+        img: Source PIL image
+        hash_size: Width and height of the hash in bits
+
+    Returns:
+        int: The hash, with the first bit as the most significant
+    """
+    if img.mode != 'L':
+        img = img.convert('L')
+    pixels = np.asarray(img.resize((hash_size + 1, hash_size), Image.Resampling.LANCZOS))
+    return _bits_to_int(pixels[:, 1:] > pixels[:, :-1])
+
+
+def make_thumbnail(img: Image.Image, max_size: Tuple[int, int]) -> Image.Image:
+    """Shrink an image to fit within `max_size` and flatten it to RGB.
+
+    For JPEG files that have not been loaded yet, `Image.draft` lets libjpeg
+    scale the image down while decoding instead of decoding every pixel.
+
+    Args:
+        img: Source PIL image
+        max_size: Maximum (width, height) of the thumbnail
+
+    Returns:
+        Image.Image: An RGB thumbnail; transparent areas are made white
+    """
+    img.draft('RGB', max_size)
+    img.thumbnail(max_size, Image.Resampling.LANCZOS)
+
+    if img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in img.info:
+        rgba = img.convert('RGBA')
+        flat = Image.new('RGB', rgba.size, (255, 255, 255))
+        flat.paste(rgba, mask=rgba.getchannel('A'))
+        return flat
+    return img.convert('RGB')
+
+
+def load_thumbnail(path: str, max_size: Tuple[int, int]) -> Image.Image:
+    """Decode an image file directly at thumbnail size.
+
+    Args:
+        path: Path to the image file
+        max_size: Maximum (width, height) of the thumbnail
+
+    Returns:
+        Image.Image: An RGB thumbnail
+    """
+    with Image.open(path) as img:
+        return make_thumbnail(img, max_size)
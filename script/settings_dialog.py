@@ -85,6 +85,9 @@ class SettingsDialog(QDialog):
             "keep_better_quality_tooltip"
         ))
         self.threshold_spin.setSuffix("%")  # Ensure suffix is set
+        self.threshold_spin.setToolTip(self.translate(
+            "similarity_threshold_tooltip"
+        ))
         
         # File Handling Group
         self.file_handling_group.setTitle(self.translate("file_handling"))
@@ -5,33 +5,71 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QPushButton,
 from PyQt6.QtGui import QDesktopServices
 from PyQt6.QtCore import Qt, QUrl, QSize, QBuffer, QTimer
 from PyQt6.QtGui import QPixmap, QImage, QIcon
-import webbrowser
 import os
 import io
 import logging
 
-# Try to import qrcode for QR code generation
-try:
-    import qrcode
-    HAS_QRCODE = True
-except ImportError:
-    qrcode = None
-    HAS_QRCODE = False
-    logging.debug("qrcode not available - QR code generation will be disabled")
+logger = logging.getLogger(__name__)
 
-try:
-    from wand.image import Image as WandImage
-    from wand.drawing import Drawing
-    from wand.color import Color
-    HAS_WAND = True
-except ImportError:
-    WandImage = None
-    Drawing = None
-    Color = None
-    HAS_WAND = False
-    logging.debug("wand not available - QR code generation will be disabled")
+def make_qr_pixmap(data, box_size=10, border=4):
+    """Render data as a QR code pixmap.
+    
+    qrcode and Wand are imported here rather than at module level, so
+    importing this module at startup does not pay for them until the
+    dialog is actually opened.
+    
+    Args:
+        data: Text to encode
+        box_size: Size of one QR module in pixels
+        border: Quiet zone around the code, in modules
+        
+    Returns:
+        QPixmap with the QR code, or None if qrcode or Wand is unavailable
+    """
+    try:
+        import qrcode
+        from wand.image import Image as WandImage
+        from wand.drawing import Drawing
+        from wand.color import Color
+    except ImportError as e:
+        logger.debug(f"QR code generation disabled: {e}")
+        return None
+    
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=box_size,
+        border=border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    
+    # Draw QR code with Wand
+    matrix = qr.get_matrix()
+    width = (len(matrix[0]) + border * 2) * box_size
+    height = (len(matrix) + border * 2) * box_size
 
-logger = logging.getLogger(__name__)
+    with WandImage(width=width, height=height, background=Color('white')) as img:
+        with Drawing() as draw:
+            draw.fill_color = Color('black')
+            # Draw black squares where matrix cell is True
+            for r, row in enumerate(matrix):
+                for c, cell in enumerate(row):
+                    if cell:
+                        x0 = (c + border) * box_size
+                        y0 = (r + border) * box_size
+                        x1 = x0 + box_size - 1
+                        y1 = y0 + box_size - 1
+                        draw.rectangle(left=x0, top=y0, right=x1, bottom=y1)
+            draw(img)
+        img.format = 'png'
+        buffer = io.BytesIO()
+        img.save(file=buffer)
+        png = buffer.getvalue()
+
+    pixmap = QPixmap()
+    pixmap.loadFromData(png, "PNG")
+    return pixmap
 
 class SponsorDialog(QDialog):
     def __init__(self, parent=None, language_manager=None):
@@ -108,45 +146,8 @@ class SponsorDialog(QDialog):
         """)
         
         # Generate QR Code (only if dependencies are available)
-        if HAS_QRCODE and HAS_WAND and WandImage and Drawing and Color:
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(f'monero:{monero_address}')
-            qr.make(fit=True)
-            
-            # Draw QR code with Wand
-            matrix = qr.get_matrix()
-            box_size = 10
-            border = 4
-            width = (len(matrix[0]) + border * 2) * box_size
-            height = (len(matrix) + border * 2) * box_size
-
-            with WandImage(width=width, height=height, background=Color('white')) as img:
-                with Drawing() as draw:
-                    draw.fill_color = Color('black')
-                    # Draw black squares where matrix cell is True
-                    for r, row in enumerate(matrix):
-                        for c, cell in enumerate(row):
-                            if cell:
-                                x0 = (c + border) * box_size
-                                y0 = (r + border) * box_size
-                                x1 = x0 + box_size - 1
-                                y1 = y0 + box_size - 1
-                                draw.rectangle(left=x0, top=y0, right=x1, bottom=y1)
-                    draw(img)
-                img.format = 'png'
-                buffer = io.BytesIO()
-                img.save(file=buffer)
-                data = buffer.getvalue()
-
-            # Load into QPixmap
-            pixmap = QPixmap()
-            pixmap.loadFromData(data, "PNG")
-            
+        pixmap = make_qr_pixmap(f'monero:{monero_address}')
+        if pixmap is not None:
             # Scale the pixmap to a reasonable size
             pixmap = pixmap.scaled(200, 200, Qt.AspectRatioMode.KeepAspectRatio, 
                                  Qt.TransformationMode.SmoothTransformation)
@@ -167,8 +168,8 @@ class SponsorDialog(QDialog):
         else:
             # QR code not available, adjust layout
             grid.addWidget(QLabel("<h3>>Ways to Support:</h3>"), 0, 0, 1, 2)
-            grid.addWidget(github_label, 1, 0, 1, 2)
-            grid.addWidget(paypal_label, 2, 0, 1, 2)
+            grid.addWidget(github_button, 1, 0, 1, 2)
+            grid.addWidget(paypal_button, 2, 0, 1, 2)
             grid.addWidget(monero_label, 3, 0, 1, 2)
             grid.addWidget(monero_address_label, 4, 0, 1, 2)
             
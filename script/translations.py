@@ -16,6 +16,9 @@ TRANSLATIONS = {
         'duplicates_found': 'Duplicates Found',
         'original_image': 'Original Image',
         'duplicate_image': 'Duplicate Image',
+        'image_preview': 'Image Preview',
+        'loading_preview': 'Loading preview...',
+        'preview_not_available': 'Preview not available',
         'select_all': 'Select All',
         'select_none': 'Select None',
         'delete_selected': 'Delete Selected',
@@ -48,6 +51,7 @@ TRANSLATIONS = {
         
         # Status messages
         'comparing_images': 'Comparing images...',
+        'folder_selected': 'Selected folder: {folder}',
         'deleting_files': 'Deleting files...',
         'files_deleted': '{count} files deleted.',
         'no_files_selected': 'No files selected for deletion.',
@@ -235,6 +239,7 @@ TRANSLATIONS = {
         'search_subdirectories': 'Search subdirectories',
         'keep_better_quality': 'Keep better quality duplicates',
         'keep_better_quality_tooltip': 'When enabled, keeps the highest quality version of duplicate images',
+        'similarity_threshold_tooltip': 'How closely two images must match to count as duplicates. Candidates must have perceptual hashes within 0 (at 100%) to 10 (at 70%) bits of each other, and the share of pixel variation they have in common must reach this percentage. Plain single-colour images are compared by their average colour instead.',
         'file_handling': 'File Handling',
         'preserve_metadata': 'Preserve metadata when deleting',
         'preserve_metadata_tooltip': 'Preserve metadata (EXIF, etc.) when deleting duplicate files',
@@ -311,6 +316,9 @@ TRANSLATIONS = {
         'duplicates_found': 'Duplicati Trovati',
         'original_image': 'Immagine Originale',
         'duplicate_image': 'Immagine Duplicata',
+        'image_preview': 'Anteprima Immagine',
+        'loading_preview': 'Caricamento anteprima...',
+        'preview_not_available': 'Anteprima non disponibile',
         'select_all': 'Seleziona Tutto',
         'select_none': 'Deseleziona Tutto',
         'delete_selected': 'Elimina Selezionati',
@@ -343,6 +351,7 @@ TRANSLATIONS = {
         
         # Status messages
         'comparing_images': 'Confronto delle immagini in corso...',
+        'folder_selected': 'Cartella selezionata: {folder}',
         'deleting_files': 'Eliminazione file in corso...',
         'files_deleted': '{count} file eliminati.',
         'no_files_selected': 'Nessun file selezionato per l\'eliminazione.',
@@ -512,6 +521,7 @@ TRANSLATIONS = {
         'search_subdirectories': 'Cerca nelle sottocartelle',
         'keep_better_quality': 'Mantieni i duplicati di qualità migliore',
         'keep_better_quality_tooltip': 'Se attivato, mantiene la versione di qualità migliore delle immagini duplicate',
+        'similarity_threshold_tooltip': 'Quanto due immagini devono somigliarsi per essere considerate duplicati. Gli hash percettivi devono differire al massimo di 0 (al 100%) - 10 (al 70%) bit, e la quota di variazione dei pixel in comune deve raggiungere questa percentuale. Le immagini a tinta unita vengono confrontate in base al colore medio.',
         'file_handling': 'Gestione File',
         'preserve_metadata': 'Mantieni i metadati durante l\'eliminazione',
         'preserve_metadata_tooltip': 'Mantiene i metadati (EXIF, ecc.) durante l\'eliminazione dei file duplicati',
@@ -5,6 +5,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import shutil
 import os
+import threading
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 import logging
@@ -96,6 +97,8 @@ class UndoManager:
         """
         self.operations: List[FileOperation] = []
         self.max_history = max_history
+        # move_to_trash also runs on the delete worker's pool thread
+        self._lock = threading.RLock()
     
     def add_operation(self, operation: FileOperation) -> None:
         """
@@ -104,19 +107,22 @@ class UndoManager:
         Args:
             operation: The operation to add
         """
-        self.operations.append(operation)
-        
-        # Trim history if it gets too large
-        if len(self.operations) > self.max_history:
-            self.operations.pop(0)
+        with self._lock:
+            self.operations.append(operation)
+            
+            # Trim history if it gets too large
+            if len(self.operations) > self.max_history:
+                self.operations.pop(0)
     
     def can_undo(self) -> bool:
         """Return True if there are operations that can be undone."""
-        return len(self.operations) > 0
+        with self._lock:
+            return len(self.operations) > 0
     
     def get_last_operation(self) -> Optional[FileOperation]:
         """Get the last operation without removing it."""
-        return self.operations[-1] if self.operations else None
+        with self._lock:
+            return self.operations[-1] if self.operations else None
     
     def undo_last_operation(self) -> bool:
         """
@@ -125,15 +131,16 @@ class UndoManager:
         Returns:
             bool: True if the operation was successfully undone, False otherwise
         """
-        if not self.operations:
-            return False
-            
-        operation = self.operations.pop()
+        with self._lock:
+            if not self.operations:
+                return False
+            operation = self.operations.pop()
         return operation.undo()
     
     def clear(self) -> None:
         """Clear all operations from the history."""
-        self.operations.clear()
+        with self._lock:
+            self.operations.clear()
     
     def move_to_trash(self, file_path: str) -> str:
         """
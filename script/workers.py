@@ -4,14 +4,17 @@ Worker classes for background tasks in Image Deduplicator.
 import os
 import concurrent.futures
 import hashlib
-import json
+import itertools
 import shutil
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set, Any, Union
-from datetime import datetime, timedelta
+from datetime import datetime
 import tempfile
 import io
 import pickle
+import sqlite3
+import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
 
@@ -117,18 +120,36 @@ class ProgressManager:
             return False
 
 from wand.image import Image as WandImage
-import imagehash
+from PIL import Image
 from PyQt6.QtCore import QRunnable, QObject, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QImage
 
 # Import logger from our centralized module
 from script.logger import logger
+from script.image_utils import (
+    compare_image_quality, difference_hash, grayscale_thumbnail, load_comparison_image,
+    load_hash_thumbnail, load_thumbnail, make_thumbnail, perceptual_hash
+)
+from script.hash_index import HammingIndex
 
 # Constants
-CACHE_FILE = Path("cache/image_hashes.json")
+CACHE_FILE = Path("cache/image_hashes.db")
 CACHE_EXPIRY_DAYS = 7  # Number of days to keep cache entries
+CACHE_SCHEMA_VERSION = 4  # Bump when the stored hashes change meaning
+CACHE_COMMIT_INTERVAL = 500  # New cache entries written per transaction
+HASH_THUMBNAIL_SIZE = 32  # Side of the grayscale thumbnail the hashes are computed from
+PREFIX_DIGEST_BYTES = 64 * 1024  # Bytes read to tell same-size files apart cheaply
+PREVIEW_SIZE = (800, 600)  # Maximum size of preview thumbnails
+COMPARE_SIZE = 128  # Side of the RGB images used for the pixel similarity check
+PROGRESS_INTERVAL = 1 / 30  # Minimum seconds between progress signals
+MIN_SIMILARITY_THRESHOLD = 70  # Lowest similarity threshold the settings allow
+MAX_HASH_DISTANCE = 10  # Hamming radius used at the lowest similarity threshold
+# Hashing runs on threads rather than processes: Pillow releases the GIL while
+# decoding, which dominates the cost, and a thread pool avoids pickling the
+# worker state and re-importing Qt in child processes of the frozen app
 MAX_WORKERS = os.cpu_count() or 4  # Number of worker threads
-CHUNK_SIZE = 50  # Number of images to process in each chunk
-SUPPORTED_IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp', '.psd', '.gif', '.bmp'}
+MAX_PENDING_HASHES = MAX_WORKERS * 4  # Hash tasks queued on the pool at any time
+SUPPORTED_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.tiff', '.tif', '.webp', '.psd', '.gif', '.bmp'})
 
 class WorkerSignals(QObject):
     """Defines the signals available from a running worker thread."""
@@ -142,98 +163,210 @@ class WorkerSignals(QObject):
     progress_loaded = pyqtSignal(bool)  # Whether progress was successfully loaded
     state_changed = pyqtSignal(str)  # Current state as string
 
+class DeleteSignals(QObject):
+    """Defines the signals available from a delete worker."""
+    progress = pyqtSignal(int)  # Number of files processed so far
+    finished = pyqtSignal(list, list)  # deleted paths, failed paths
+
+class ThumbnailSignals(QObject):
+    """Defines the signals available from a thumbnail worker."""
+    finished = pyqtSignal(str, QImage)  # image path, thumbnail (null if loading failed)
+
+def load_pil_image_with_wand(img_path: str, max_size: Optional[Tuple[int, int]] = None,
+                             keep_aspect: bool = True) -> Image.Image:
+    """Decode an image with Wand and return it as an sRGB PIL Image.
+    
+    Args:
+        img_path: Path to the image file
+        max_size: If given, the image is shrunk inside ImageMagick to at most
+            this (width, height), so only a small image is handed to Pillow
+        keep_aspect: Whether shrinking keeps the aspect ratio; callers that
+            stretch the result to a square anyway can shrink each axis alone
+        
+    Returns:
+        The decoded PIL Image
+    """
+    with WandImage(filename=img_path) as img:
+        if max_size is not None:
+            width, height = max_size
+            if keep_aspect:
+                scale = min(width / img.width, height / img.height, 1.0)
+                width, height = round(img.width * scale), round(img.height * scale)
+            else:
+                width, height = min(width, img.width), min(height, img.height)
+            if (width, height) != img.size:
+                img.resize(max(1, width), max(1, height), filter='box')
+        
+        # Convert to RGB if needed (for consistent hashing)
+        if img.colorspace != 'srgb':
+            img.transform_colorspace('srgb')
+        
+        # Convert Wand image to PIL Image in memory
+        img_buffer = io.BytesIO()
+        img.format = 'PNG'
+        img.save(file=img_buffer)
+        img_buffer.seek(0)
+        
+        pil_img = Image.open(img_buffer)
+        pil_img.load()
+        return pil_img
+
 class HashCache:
-    """Handles caching of image hashes to disk for faster subsequent runs."""
+    """Handles caching of image hashes to disk for faster subsequent runs.
+    
+    Entries are stored in an SQLite database and keyed by path, modification
+    time and file size, so unchanged files never need to be decoded again.
+    """
     
     def __init__(self, cache_file: Path = CACHE_FILE):
         """Initialize the hash cache."""
         self.cache_file = cache_file
         self.cache_dir = cache_file.parent
-        self.cache: Dict[str, Dict] = {}
-        self._load_cache()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._hits: List[str] = []  # Paths whose entries should not expire yet
+        self._uncommitted = 0  # Entries set since the last commit
+        self._open()
     
-    def _load_cache(self) -> None:
-        """Load the cache from disk."""
+    def _open(self) -> None:
+        """Open the cache database, creating it if needed."""
         try:
-            if not self.cache_file.exists():
-                self.cache = {}
-                return
-                
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.cache = data.get('hashes', {})
-                
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # The connection is shared by the hashing threads and guarded by a lock
+            self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+            # With a write-ahead log, the periodic commits during a scan only
+            # append to the log instead of syncing the whole database
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            
+            # Entries written by an older version hold different hashes
+            version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != CACHE_SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS hashes")
+                self._conn.execute(f"PRAGMA user_version = {CACHE_SCHEMA_VERSION}")
+            
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS hashes (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    phash TEXT NOT NULL,
+                    dhash TEXT NOT NULL,
+                    timestamp REAL NOT NULL
+                )"""
+            )
+            self._conn.commit()
+            
             # Clean up expired entries
             self.cleanup()
             
-        except (json.JSONDecodeError, IOError) as e:
-            logger.warning(f"Failed to load hash cache: {e}")
-            self.cache = {}
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Failed to open hash cache: {e}")
+            self._conn = None
     
     def save(self) -> None:
-        """Save the cache to disk."""
+        """Commit pending cache entries to disk.
+        
+        Entries that were read since the last save get a fresh timestamp,
+        so files that are still being scanned do not expire.
+        """
+        if self._conn is None:
+            return
         try:
-            self.cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_file, 'w', encoding='utf-8') as f:
-                json.dump({'hashes': self.cache}, f, indent=2)
-        except IOError as e:
+            with self._lock:
+                hits, self._hits = self._hits, []
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE hashes SET timestamp = ? WHERE path = ?",
+                    ((now, path) for path in hits)
+                )
+                self._conn.commit()
+                self._uncommitted = 0
+        except sqlite3.Error as e:
             logger.warning(f"Failed to save hash cache: {e}")
     
-    def get(self, file_path: str) -> Optional[dict]:
-        """Get a cache entry for the given file path."""
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        if self._conn is None:
+            return
+        self.save()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+    
+    def get(self, file_path: str, stat: Optional[os.stat_result] = None) -> Optional[dict]:
+        """Get a cache entry for the given file path.
+        
+        Args:
+            file_path: Path to the image file
+            stat: Stat result of the file, if already known from scanning
+        """
+        if self._conn is None:
+            return None
         try:
-            entry = self.cache.get(file_path)
-            if not entry:
-                return None
-                
-            # Check if the file has been modified since caching
-            mtime = os.path.getmtime(file_path)
-            if entry.get('mtime') != mtime:
-                return None
-                
-            # Check if the entry is expired
-            cache_time = datetime.fromisoformat(entry['timestamp'])
-            if datetime.now() - cache_time > timedelta(days=CACHE_EXPIRY_DAYS):
-                return None
-                
-            return entry
-            
-        except (OSError, KeyError, ValueError) as e:
+            # Entries only match if the file is unchanged since caching
+            if stat is None:
+                stat = os.stat(file_path)
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT phash, dhash FROM hashes WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    (file_path, stat.st_mtime_ns, stat.st_size)
+                ).fetchone()
+                if row is not None:
+                    self._hits.append(file_path)
+        except (OSError, sqlite3.Error) as e:
             logger.debug(f"Cache miss for {file_path}: {e}")
             return None
+        
+        if row is None:
+            return None
+        return {'phash': row[0], 'dhash': row[1]}
     
-    def set(self, file_path: str, phash: str, ahash: str) -> None:
-        """Set a cache entry for the given file path."""
+    def set(self, file_path: str, phash: str, dhash: str,
+            stat: Optional[os.stat_result] = None) -> None:
+        """Set a cache entry for the given file path.
+        
+        Args:
+            file_path: Path to the image file
+            phash: Perceptual hash as a hex string
+            dhash: Difference hash as a hex string
+            stat: Stat result of the file, if already known from scanning
+        """
+        if self._conn is None:
+            return
         try:
-            mtime = os.path.getmtime(file_path)
-            self.cache[file_path] = {
-                'phash': phash,
-                'ahash': ahash,
-                'mtime': mtime,
-                'timestamp': datetime.now().isoformat()
-            }
-        except OSError as e:
+            if stat is None:
+                stat = os.stat(file_path)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                    (file_path, stat.st_mtime_ns, stat.st_size, phash, dhash, time.time())
+                )
+                # Commit in batches, so a stopped scan keeps what it hashed
+                self._uncommitted += 1
+                if self._uncommitted >= CACHE_COMMIT_INTERVAL:
+                    self._conn.commit()
+                    self._uncommitted = 0
+        except (OSError, sqlite3.Error) as e:
             logger.warning(f"Failed to cache hash for {file_path}: {e}")
     
     def cleanup(self) -> None:
         """Remove expired cache entries."""
-        expired_time = datetime.now() - timedelta(days=CACHE_EXPIRY_DAYS)
-        to_remove = []
+        if self._conn is None:
+            return
+        expired_time = time.time() - CACHE_EXPIRY_DAYS * 24 * 60 * 60
+        try:
+            with self._lock:
+                removed = self._conn.execute(
+                    "DELETE FROM hashes WHERE timestamp < ?", (expired_time,)
+                ).rowcount
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to clean up hash cache: {e}")
+            return
         
-        for path, entry in self.cache.items():
-            try:
-                cache_time = datetime.fromisoformat(entry['timestamp'])
-                if cache_time < expired_time:
-                    to_remove.append(path)
-            except (KeyError, ValueError):
-                to_remove.append(path)
-        
-        for path in to_remove:
-            self.cache.pop(path, None)
-        
-        if to_remove:
-            logger.debug(f"Cleaned up {len(to_remove)} expired cache entries")
-            self.save()
+        if removed:
+            logger.debug(f"Cleaned up {removed} expired cache entries")
 
 class ImageMetadata:
     """Helper class to handle image metadata operations."""
@@ -340,7 +473,8 @@ class ImageComparisonWorker(QRunnable):
                  similarity_threshold: int = 85,
                  keep_better_quality: bool = True,
                  preserve_metadata: bool = True,
-                 batch_size: int = 50):
+                 batch_size: int = 50,
+                 hash_cache: Optional[HashCache] = None):
         """Initialize the image comparison worker.
         
         Args:
@@ -350,6 +484,8 @@ class ImageComparisonWorker(QRunnable):
             keep_better_quality: Whether to keep the higher quality image from duplicates
             preserve_metadata: Whether to preserve metadata when keeping the best quality image
             batch_size: Number of images to process in each batch (default: 50)
+            hash_cache: Cache to use instead of the one in CACHE_FILE; the
+                worker closes it when a run ends
         """
         super().__init__()
         self.folder = os.path.abspath(folder)
@@ -363,111 +499,284 @@ class ImageComparisonWorker(QRunnable):
         self._stop_requested = False
         
         # Initialize hash cache
-        self.hash_cache = HashCache()
+        self.hash_cache = hash_cache if hash_cache is not None else HashCache()
         
         # Track processed files and batches
         self._processed_count = 0
         self._total_files = 0
+        self._last_progress = -1
+        self._last_progress_time = 0.0
+        
+        # Byte-identical copies found before hashing, mapped to their source
+        self._identical_files: Dict[str, str] = {}
     
     def stop(self) -> None:
         """Request the worker to stop processing."""
         self._stop_requested = True
         self.is_running = False
     
-    def _get_image_files(self, folder: str) -> List[str]:
-        """Get a list of image files in the specified folder."""
+    def _emit_progress(self, progress: int, force: bool = False) -> None:
+        """Emit a progress update, coalescing updates that arrive too quickly.
+        
+        Args:
+            progress: Progress percentage
+            force: Emit even if the last update was less than PROGRESS_INTERVAL ago
+        """
+        if progress == self._last_progress:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_progress_time < PROGRESS_INTERVAL:
+            return
+        self._last_progress = progress
+        self._last_progress_time = now
+        self.signals.progress.emit(progress)
+    
+    def _get_image_files(self, folder: str) -> List[Tuple[str, os.stat_result]]:
+        """Get the image files in the specified folder along with their stat results.
+        
+        The tree is walked once with `os.scandir`, so the directory entries
+        and stat results gathered here are reused by the cache lookups.
+        
+        Args:
+            folder: Folder to scan
+            
+        Returns:
+            List of (absolute path, stat result) tuples
+        """
         image_files = []
+        pending = [os.path.abspath(folder)]
         
-        try:
-            if self.recursive:
-                for root, _, files in os.walk(folder):
-                    if self._stop_requested:
-                        return []
-                        
-                    for f in files:
-                        ext = os.path.splitext(f)[1].lower()
-                        if ext in SUPPORTED_IMAGE_EXTENSIONS:
-                            image_files.append(os.path.abspath(os.path.join(root, f)))
-            else:
-                for f in os.listdir(folder):
-                    if self._stop_requested:
-                        return []
-                        
-                    ext = os.path.splitext(f)[1].lower()
-                    if ext in SUPPORTED_IMAGE_EXTENSIONS:
-                        image_files.append(os.path.abspath(os.path.join(folder, f)))
-                        
-        except OSError as e:
-            logger.error(f"Error scanning directory: {e}")
-            self.signals.error.emit(f"Error scanning directory: {e}")
-            return []
+        while pending:
+            if self._stop_requested:
+                return []
+                
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                if self.recursive:
+                                    pending.append(entry.path)
+                            elif (os.path.splitext(entry.name)[1].lower() in SUPPORTED_IMAGE_EXTENSIONS
+                                    and entry.is_file()):
+                                image_files.append((entry.path, entry.stat()))
+                        except OSError as e:
+                            logger.warning(f"Could not read {entry.path}: {e}")
+            except OSError as e:
+                if directory == os.path.abspath(folder):
+                    logger.error(f"Error scanning directory: {e}")
+                    self.signals.error.emit(f"Error scanning directory: {e}")
+                    return []
+                logger.warning(f"Skipping unreadable directory {directory}: {e}")
         
         return image_files
         
-    def _group_files_by_size(self, file_paths: List[str]) -> Dict[int, List[str]]:
+    def _group_files_by_size(self, image_files: List[Tuple[str, os.stat_result]]) -> Dict[int, List[str]]:
         """Group files by their size in bytes.
         
         Args:
-            file_paths: List of file paths to group
+            image_files: List of (file path, stat result) tuples to group
             
         Returns:
             Dictionary mapping file sizes to lists of file paths with that size
         """
         size_groups = {}
-        for file_path in file_paths:
-            try:
-                size = os.path.getsize(file_path)
-                if size in size_groups:
-                    size_groups[size].append(file_path)
-                else:
-                    size_groups[size] = [file_path]
-            except OSError as e:
-                logger.warning(f"Could not get size for {file_path}: {e}")
+        for file_path, stat in image_files:
+            if stat.st_size in size_groups:
+                size_groups[stat.st_size].append(file_path)
+            else:
+                size_groups[stat.st_size] = [file_path]
         return size_groups
     
-    def _get_image_hashes(self, img_path: str) -> Tuple[str, str]:
-        """Get the perceptual and average hashes for an image.
+    def _file_digest(self, file_path: str, limit: Optional[int] = None) -> Optional[bytes]:
+        """Compute a BLAKE2 digest of a file's contents.
+        
+        Args:
+            file_path: Path to the file
+            limit: Only hash the first `limit` bytes if given
+            
+        Returns:
+            The digest, or None if the file could not be read
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        remaining = limit
+        try:
+            with open(file_path, 'rb') as f:
+                while remaining is None or remaining > 0:
+                    chunk = f.read(1024 * 1024 if remaining is None else min(remaining, 1024 * 1024))
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    if remaining is not None:
+                        remaining -= len(chunk)
+        except OSError as e:
+            logger.warning(f"Could not read {file_path}: {e}")
+            return None
+        return digest.digest()
+    
+    def _split_by_digest(self, file_paths: List[str], limit: Optional[int] = None) -> List[List[str]]:
+        """Split files into groups sharing the same content digest.
+        
+        Args:
+            file_paths: Files to compare
+            limit: Only compare the first `limit` bytes if given
+            
+        Returns:
+            Groups of two or more files with equal digests
+        """
+        by_digest: Dict[bytes, List[str]] = {}
+        for file_path in file_paths:
+            digest = self._file_digest(file_path, limit)
+            if digest is not None:
+                by_digest.setdefault(digest, []).append(file_path)
+        return [paths for paths in by_digest.values() if len(paths) > 1]
+    
+    def _find_identical_files(self, image_files: List[Tuple[str, os.stat_result]]) -> Dict[str, str]:
+        """Find byte-identical copies without decoding any image.
+        
+        Files are grouped by size first; only files sharing a size are read,
+        first just a prefix and then in full for the prefix collisions.
+        
+        Args:
+            image_files: List of (file path, stat result) tuples
+            
+        Returns:
+            Dictionary mapping each redundant copy to the file it is identical to
+        """
+        identical = {}
+        for size, file_paths in self._group_files_by_size(image_files).items():
+            if len(file_paths) < 2:
+                continue
+                
+            for candidates in self._split_by_digest(sorted(file_paths), PREFIX_DIGEST_BYTES):
+                if self._stop_requested:
+                    return {}
+                    
+                # Small files were already read in full by the prefix pass
+                groups = [candidates] if size <= PREFIX_DIGEST_BYTES else self._split_by_digest(candidates)
+                for group in groups:
+                    for copy in group[1:]:
+                        identical[copy] = group[0]
+        
+        return identical
+    
+    def _get_image_hashes(self, img_path: str,
+                          stat: Optional[os.stat_result] = None) -> Optional[Tuple[str, str]]:
+        """Get the perceptual and difference hashes for an image.
         
         Args:
             img_path: Path to the image file
+            stat: Stat result of the file, if already known from scanning
             
         Returns:
-            Tuple of (phash, ahash) as strings
+            Tuple of (phash, dhash) as strings, or None if the image could not be read
         """
         # Try to get from cache first
-        cache_entry = self.hash_cache.get(img_path)
+        cache_entry = self.hash_cache.get(img_path, stat)
         if cache_entry:
-            return cache_entry['phash'], cache_entry['ahash']
+            return cache_entry['phash'], cache_entry['dhash']
         
         try:
-            with WandImage(filename=img_path) as img:
-                # Convert to RGB if needed (for consistent hashing)
-                if img.colorspace != 'srgb':
-                    img.transform_colorspace('srgb')
-                
-                # Convert Wand image to PIL Image in memory
-                img_buffer = io.BytesIO()
-                img.format = 'PNG'
-                img.save(file=img_buffer)
-                img_buffer.seek(0)
-                
-                # Create PIL Image from buffer
-                from PIL import Image
-                pil_img = Image.open(img_buffer)
-                
-                # Generate hashes
-                phash = str(imagehash.phash(pil_img))
-                ahash = str(imagehash.average_hash(pil_img))
-                
-                # Cache the results
-                self.hash_cache.set(img_path, phash, ahash)
-                
-                return phash, ahash
+            # Shrink to grayscale once; both hashes only need a few pixels
+            thumb = self._load_hash_thumbnail(img_path)
+            
+            # Generate hashes
+            phash = format(perceptual_hash(thumb), '016x')
+            dhash = format(difference_hash(thumb), '016x')
+            
+            # Cache the results
+            self.hash_cache.set(img_path, phash, dhash, stat)
+            
+            return phash, dhash
                 
         except Exception as e:
             logger.warning(f"Error processing {img_path}: {e}")
-            # Return a dummy hash to avoid breaking the processing
-            return "0" * 16, "0" * 16
+            return None
+    
+    def _load_hash_thumbnail(self, img_path: str) -> Image.Image:
+        """Decode an image into the small grayscale thumbnail used for hashing.
+        
+        Pillow is tried first because it can skip most of the JPEG decode;
+        formats it cannot read are decoded in full with Wand. Images that
+        Pillow refuses as decompression bombs are not handed to Wand, which
+        would decode them in full anyway.
+        
+        Args:
+            img_path: Path to the image file
+            
+        Returns:
+            The grayscale hashing thumbnail
+        """
+        try:
+            return load_hash_thumbnail(img_path, HASH_THUMBNAIL_SIZE)
+        except Image.DecompressionBombError:
+            raise
+        except Exception as e:
+            logger.debug(f"Pillow could not decode {img_path}, using Wand: {e}")
+            wand_size = (HASH_THUMBNAIL_SIZE * 2, HASH_THUMBNAIL_SIZE * 2)
+            return grayscale_thumbnail(
+                self._load_pil_image(img_path, wand_size, keep_aspect=False), HASH_THUMBNAIL_SIZE
+            )
+    
+    def _load_pil_image(self, img_path: str, max_size: Optional[Tuple[int, int]] = None,
+                        keep_aspect: bool = True) -> Image.Image:
+        """Decode an image with Wand and return it as an sRGB PIL Image.
+        
+        Args:
+            img_path: Path to the image file
+            max_size: Optional (width, height) to shrink the image to in ImageMagick
+            keep_aspect: Whether shrinking keeps the aspect ratio
+            
+        Returns:
+            The decoded PIL Image
+        """
+        return load_pil_image_with_wand(img_path, max_size, keep_aspect)
+    
+    def _load_comparison_image(self, img_path: str) -> Image.Image:
+        """Decode an image into the small RGB image used for pixel comparison.
+        
+        Args:
+            img_path: Path to the image file
+            
+        Returns:
+            A COMPARE_SIZE x COMPARE_SIZE RGB image
+        """
+        try:
+            return load_comparison_image(img_path, COMPARE_SIZE)
+        except Image.DecompressionBombError:
+            raise
+        except Exception as e:
+            logger.debug(f"Pillow could not decode {img_path}, using Wand: {e}")
+            wand_size = (COMPARE_SIZE * 2, COMPARE_SIZE * 2)
+            return self._load_pil_image(img_path, wand_size, keep_aspect=False).convert('RGB').resize(
+                (COMPARE_SIZE, COMPARE_SIZE), Image.Resampling.BILINEAR
+            )
+    
+    def _is_similar(self, original_path: str, duplicate_path: str,
+                    images: Optional[Dict[str, Image.Image]] = None) -> bool:
+        """Check the pixel similarity of two images against the threshold.
+        
+        Args:
+            original_path: Path to the original image
+            duplicate_path: Path to the candidate duplicate
+            images: Already decoded comparison images by path; new decodes are added to it
+            
+        Returns:
+            bool: True if the images are at least `similarity_threshold` percent similar
+        """
+        if images is None:
+            images = {}
+        try:
+            # The original is shared by its whole group, so decode it only once
+            for path in (original_path, duplicate_path):
+                if path not in images:
+                    images[path] = self._load_comparison_image(path)
+            similarity = compare_image_quality(images[original_path], images[duplicate_path])
+            return round(similarity * 100) >= self.similarity_threshold
+        except Exception as e:
+            logger.warning(f"Error comparing {original_path} and {duplicate_path}: {e}")
+            return False
     
     def _get_image_quality_score(self, img_path: str) -> Tuple[int, int]:
         """Calculate a quality score for an image.
@@ -479,85 +788,122 @@ class ImageComparisonWorker(QRunnable):
             Tuple of (resolution_score, file_size)
         """
         try:
-            with WandImage(filename=img_path) as img:
-                # Resolution score (width * height)
-                resolution = img.width * img.height
-                # File size in bytes
-                file_size = os.path.getsize(img_path)
-                return (resolution, file_size)
+            # File size in bytes
+            file_size = os.path.getsize(img_path)
+            try:
+                # Opening an image only reads its header, not the pixels
+                with Image.open(img_path) as img:
+                    width, height = img.size
+            except Exception:
+                # Pinging also reads only the header, for formats Pillow cannot open
+                with WandImage.ping(filename=img_path) as img:
+                    width, height = img.width, img.height
+            # Resolution score (width * height)
+            return (width * height, file_size)
         except Exception as e:
             logger.warning(f"Error getting quality for {img_path}: {e}")
             return (0, 0)
     
-    def _process_image_chunk(self, chunk: List[str]) -> Dict[str, List[str]]:
-        """Process a chunk of images and return their hashes.
+    def _hash_image(self, img_path: str,
+                    stat: Optional[os.stat_result] = None) -> Tuple[str, Optional[int]]:
+        """Compute the perceptual hash of a single image as an integer.
         
         Args:
-            chunk: List of image file paths to process
+            img_path: Path to the image file
+            stat: Stat result of the file, if already known from scanning
             
         Returns:
-            Dictionary mapping combined hashes to lists of matching file paths
+            Tuple of (image path, 64-bit phash or None if stopped or unreadable)
         """
-        chunk_hashes = {}
-        processed = 0
-        total = len(chunk)
+        if self._stop_requested:
+            return img_path, None
+            
+        hashes = self._get_image_hashes(img_path, stat)
+        if hashes is None:
+            return img_path, None
+        return img_path, int(hashes[0], 16)
+    
+    def _max_hash_distance(self) -> int:
+        """Translate the similarity threshold into a Hamming radius on 64-bit hashes.
         
-        for img_path in chunk:
-            if self._stop_requested:
-                return {}
-                
-            try:
-                # Update progress for this chunk
-                processed += 1
-                if processed % 10 == 0:  # Update progress every 10 images
-                    progress = 10 + int(80 * (self._processed_count + processed) / self._total_files)
-                    self.signals.progress.emit(min(progress, 90))
-                
-                # Get hashes for the image
-                phash, ahash = self._get_image_hashes(img_path)
-                
-                # Combine hashes for better accuracy
-                combined_hash = f"{phash}:{ahash}"
-                
-                # Add to results
-                if combined_hash in chunk_hashes:
-                    chunk_hashes[combined_hash].append(img_path) 
+        Thresholds from MIN_SIMILARITY_THRESHOLD to 100% map linearly onto
+        MAX_HASH_DISTANCE down to 0 bits. Wider radii are never used: with
+        thousands of group leaders, an unrelated image would likely land
+        within range of one of them.
+        """
+        threshold = max(MIN_SIMILARITY_THRESHOLD, min(100, self.similarity_threshold))
+        return round((100 - threshold) * MAX_HASH_DISTANCE / (100 - MIN_SIMILARITY_THRESHOLD))
+    
+    def _group_similar(self, hashes: Dict[str, int]) -> List[List[str]]:
+        """Group images whose perceptual hashes are within the Hamming radius.
+        
+        Each new image joins the group of the closest existing group leader;
+        leaders are kept in a flat uint64 index that is scanned in bulk.
+        Hashes seen before are looked up in a dict instead, so exact matches
+        skip the scan and always land in the same group.
+        
+        Args:
+            hashes: Mapping of image paths to their 64-bit phash
+            
+        Returns:
+            List of groups, each a list of image paths (leader first)
+        """
+        max_distance = self._max_hash_distance()
+        leaders = HammingIndex(len(hashes))
+        groups: List[List[str]] = []
+        group_of_hash: Dict[int, int] = {}
+        
+        # Sorted so the grouping does not depend on hashing completion order
+        for img_path in sorted(hashes):
+            phash = hashes[img_path]
+            group = group_of_hash.get(phash)
+            if group is None:
+                match = leaders.nearest(phash, max_distance)
+                if match is not None:
+                    group = match[1]
                 else:
-                    chunk_hashes[combined_hash] = [img_path]
-                    
-            except Exception as e:
-                logger.warning(f"Error processing {img_path}: {e}")
-                continue
-                
-        return chunk_hashes
+                    group = leaders.add(phash)
+                    groups.append([])
+                group_of_hash[phash] = group
+            groups[group].append(img_path)
+        
+        return groups
     
-    def _process_duplicates(self, hashes: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    def _process_duplicates(self, groups: List[List[str]]) -> Dict[str, List[str]]:
         """Process duplicate groups and keep the best quality image if enabled."""
         result = {}
         
-        for _, file_paths in hashes.items():
-            if len(file_paths) > 1:  # Only process groups with duplicates
-                # First, group by file size for additional validation
-                size_groups = self._group_files_by_size(file_paths)
+        for file_paths in groups:
+            if len(file_paths) < 2:  # Only process groups with duplicates
+                continue
                 
-                for size, same_size_files in size_groups.items():
-                    if len(same_size_files) > 1:  # Only process groups with same size
-                        if self.keep_better_quality:
-                            # Sort by quality (resolution first, then file size)
-                            same_size_files.sort(
-                                key=lambda x: self._get_image_quality_score(x),
-                                reverse=True
-                            )
-                            
-                            # Preserve metadata from the best image if needed
-                            if self.preserve_metadata and len(same_size_files) > 1:
-                                best_image = same_size_files[0]
-                                for duplicate in same_size_files[1:]:
-                                    self._preserve_metadata_for_best_image(duplicate, best_image)
-                        
-                        # The first item is considered the original (best quality if enabled)
-                        original = same_size_files[0]
-                        result[original] = same_size_files[1:]
+            if self.keep_better_quality:
+                # Sort by quality (resolution first, then file size)
+                file_paths.sort(
+                    key=lambda x: self._get_image_quality_score(x),
+                    reverse=True
+                )
+            
+            # The first item is considered the original (best quality if enabled)
+            original = file_paths[0]
+            
+            # Drop hash collisions that are not similar enough pixel-wise;
+            # byte-identical copies need no pixel comparison
+            source = self._identical_files.get(original, original)
+            images: Dict[str, Image.Image] = {}
+            duplicates = [
+                dup for dup in file_paths[1:]
+                if self._identical_files.get(dup, dup) == source or self._is_similar(original, dup, images)
+            ]
+            if not duplicates:
+                continue
+            
+            # Preserve metadata from the best image if needed
+            if self.keep_better_quality and self.preserve_metadata:
+                for duplicate in duplicates:
+                    self._preserve_metadata_for_best_image(duplicate, original)
+            
+            result[original] = duplicates
                 
         return result
     
@@ -598,75 +944,75 @@ class ImageComparisonWorker(QRunnable):
                 return
                 
             total_files = len(image_files)
-            self.signals.progress.emit(5)  # Initial progress
+            self._emit_progress(10, force=True)  # Initial progress
             
-            # First, group files by size to find potential duplicates quickly
-            size_groups = self._group_files_by_size(image_files)
-            potential_duplicates = []
-            
-            # Only process groups with more than one file of the same size
-            for size, files in size_groups.items():
-                if len(files) > 1:
-                    potential_duplicates.extend(files)
+            logger.info(f"Found {total_files} image files to process")
             
-            if not potential_duplicates:
-                self.signals.finished.emit("No potential duplicates found (based on file size).", {})
+            # Byte-identical copies share the hash of their source, so only
+            # one file of each identical set has to be decoded
+            self._identical_files = self._find_identical_files(image_files)
+            if self._stop_requested:
+                logger.info("Processing stopped by user")
                 return
-                
-            # Update progress
-            self.signals.progress.emit(10)
-            
-            # Now process only the potential duplicates with image hashing
-            image_files = potential_duplicates
-            
-            logger.info(f"Found {total_files} image files to process")
+            to_hash = [(path, stat) for path, stat in image_files if path not in self._identical_files]
+            if self._identical_files:
+                logger.info(f"Skipping decode of {len(self._identical_files)} byte-identical copies")
             
-            # Process images in chunks
-            all_hashes = {}
-            processed = 0
+            # Hash every image on its own pool task so all cores stay busy;
+            # results are merged here, on the worker thread, as they complete.
+            # Only a bounded window of tasks is queued at a time, so memory
+            # stays flat on huge folders and a stop request drains quickly
+            all_hashes: Dict[str, int] = {}
+            self._total_files = len(to_hash)
+            self._processed_count = 0
             
-            with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-                # Split into chunks for better progress reporting
-                chunks = [image_files[i:i + CHUNK_SIZE] 
-                         for i in range(0, len(image_files), CHUNK_SIZE)]
-                
-                future_to_chunk = {
-                    executor.submit(self._process_image_chunk, chunk): chunk 
-                    for chunk in chunks
-                }
-                
-                for future in concurrent.futures.as_completed(future_to_chunk):
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS)
+            pending = set()
+            remaining = iter(to_hash)
+            try:
+                while True:
+                    for path, stat in itertools.islice(remaining, MAX_PENDING_HASHES - len(pending)):
+                        pending.add(executor.submit(self._hash_image, path, stat))
+                    if not pending:
+                        break
+                    
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
                     if self._stop_requested:
                         logger.info("Processing stopped by user")
                         return
-                        
-                    chunk = future_to_chunk[future]
-                    try:
-                        chunk_result = future.result()
-                        # Merge results
-                        for key, value in chunk_result.items():
-                            if key in all_hashes:
-                                all_hashes[key].extend(value)
-                            else:
-                                all_hashes[key] = value
-                                
-                        processed += len(chunk)
-                        progress = min(95, 5 + int((processed / total_files) * 90))
-                        self.signals.progress.emit(progress)
-                        
-                    except Exception as e:
-                        logger.error(f"Error processing chunk: {e}")
-                        continue
+                    
+                    for future in done:
+                        self._processed_count += 1
+                        try:
+                            img_path, phash = future.result()
+                        except Exception as e:
+                            logger.error(f"Error hashing image: {e}")
+                            continue
+                        if phash is not None:
+                            all_hashes[img_path] = phash
+                    
+                    self._emit_progress(
+                        10 + int(85 * self._processed_count / self._total_files),
+                        force=self._processed_count == self._total_files
+                    )
+            finally:
+                # Drop queued work when stopping early (cancel_futures needs Python 3.9)
+                for future in pending:
+                    future.cancel()
+                executor.shutdown(wait=True)
+            
+            for copy, source in self._identical_files.items():
+                if source in all_hashes:
+                    all_hashes[copy] = all_hashes[source]
             
             # Process duplicates
             logger.info("Processing duplicate groups...")
-            duplicates = self._process_duplicates(all_hashes)
-            
-            # Save cache
-            self.hash_cache.save()
+            duplicates = self._process_duplicates(self._group_similar(all_hashes))
             
             # Emit finished signal
-            self.signals.progress.emit(100)
+            self._emit_progress(100, force=True)
             
             if duplicates:
                 msg = f"Found {len(duplicates)} groups of duplicate images."
@@ -679,4 +1025,92 @@ class ImageComparisonWorker(QRunnable):
             logger.error(f"Error in image comparison: {e}", exc_info=True)
             self.signals.error.emit(f"An error occurred: {str(e)}")
         finally:
+            # Commit the hashes computed so far, even if the scan was stopped,
+            # and release the database
+            self.hash_cache.close()
             self.is_running = False
+
+class ThumbnailWorker(QRunnable):
+    """Worker that decodes a preview thumbnail off the UI thread."""
+    
+    def __init__(self, img_path: str, max_size: Tuple[int, int] = PREVIEW_SIZE):
+        """Initialize the thumbnail worker.
+        
+        Args:
+            img_path: Path to the image file
+            max_size: Maximum (width, height) of the thumbnail
+        """
+        super().__init__()
+        self.img_path = img_path
+        self.max_size = max_size
+        self.signals = ThumbnailSignals()
+    
+    def _load_thumbnail(self) -> Image.Image:
+        """Decode the thumbnail with Pillow, falling back to Wand for other formats."""
+        try:
+            return load_thumbnail(self.img_path, self.max_size)
+        except Image.DecompressionBombError:
+            raise
+        except Exception as e:
+            logger.debug(f"Pillow could not decode {self.img_path}, using Wand: {e}")
+            return make_thumbnail(load_pil_image_with_wand(self.img_path, self.max_size), self.max_size)
+    
+    def run(self) -> None:
+        """Decode the thumbnail and hand it back as a QImage."""
+        try:
+            thumb = self._load_thumbnail()
+            # QImage (unlike QPixmap) may be created outside the UI thread;
+            # copy() detaches it from the temporary byte buffer
+            qimage = QImage(
+                thumb.tobytes(), thumb.width, thumb.height,
+                thumb.width * 3, QImage.Format.Format_RGB888
+            ).copy()
+        except Exception as e:
+            logger.warning(f"Error loading preview for {self.img_path}: {e}")
+            qimage = QImage()
+        
+        self.signals.finished.emit(self.img_path, qimage)
+
+class DeleteWorker(QRunnable):
+    """Worker that moves files to the trash off the UI thread."""
+    
+    def __init__(self, file_paths: List[str], undo_manager):
+        """Initialize the delete worker.
+        
+        Args:
+            file_paths: Paths of the files to move to the trash
+            undo_manager: UndoManager that trashes the files and records the undo operations;
+                its history is lock-guarded, so it may be shared with the UI thread
+        """
+        super().__init__()
+        self.file_paths = list(file_paths)
+        self.undo_manager = undo_manager
+        self.signals = DeleteSignals()
+        self._stop_requested = False
+    
+    def stop(self) -> None:
+        """Request the worker to stop after the current file."""
+        self._stop_requested = True
+    
+    def run(self) -> None:
+        """Move every file to the trash, collecting failures instead of stopping on them."""
+        deleted, failed = [], []
+        total = len(self.file_paths)
+        update_every = max(1, total // 100)
+        
+        for count, file_path in enumerate(self.file_paths, 1):
+            if self._stop_requested:
+                logger.info("Deletion stopped by user")
+                break
+                
+            try:
+                self.undo_manager.move_to_trash(file_path)
+                deleted.append(file_path)
+            except Exception as e:
+                logger.error(f"Failed to move {file_path} to trash: {e}", exc_info=True)
+                failed.append(file_path)
+            
+            if count % update_every == 0 or count == total:
+                self.signals.progress.emit(count)
+        
+        self.signals.finished.emit(deleted, failed)
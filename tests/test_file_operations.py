@@ -6,7 +6,9 @@ import sys
 import pytest
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 from PyQt6.QtWidgets import QApplication, QListWidget, QListWidgetItem, QMessageBox
 from PyQt6.QtCore import Qt
@@ -106,6 +108,19 @@ def test_undo_with_no_operations(undo_manager):
     """Test undoing when there are no operations."""
     assert undo_manager.undo_last_operation() is False
 
+def test_add_operation_from_threads(temp_dir):
+    """Test that operations recorded from several threads are all kept."""
+    manager = UndoManager(max_history=1000)
+    operations = [
+        FileOperation(operation_type='move', source=str(temp_dir / f"{i}.jpg"))
+        for i in range(800)
+    ]
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(manager.add_operation, operations))
+    
+    assert sorted(map(id, manager.operations)) == sorted(map(id, operations))
+
 def test_file_operation_undo_delete(monkeypatch, temp_dir):
     """Test undoing a delete operation with send2trash."""
     # Create a test file
@@ -227,3 +242,24 @@ def test_ui_delete_selected(qapp, temp_dir):
         
         # Verify undo manager has the operations
         assert len(ui_instance.undo_manager.operations) == len(test_files)
+
+def test_forget_deleted_duplicates():
+    """Deleted files leave the results, and groups without duplicates left are dropped."""
+    # UI imports the workers, which decode images through ImageMagick
+    try:
+        import wand.image  # noqa: F401
+    except ImportError as e:
+        pytest.skip(f"Wand/ImageMagick not available: {e}")
+    from UI import UI as UIClass
+    
+    ui = SimpleNamespace(duplicates={
+        '/photos/a.jpg': ['/photos/a1.jpg', '/photos/a2.jpg'],
+        '/photos/b.jpg': ['/photos/b1.jpg'],
+        '/photos/c.jpg': ['/photos/c1.jpg'],
+    })
+    UIClass._forget_deleted_duplicates(ui, ['/photos/a1.jpg', '/photos/b1.jpg', '/photos/missing.jpg'])
+    
+    assert ui.duplicates == {
+        '/photos/a.jpg': ['/photos/a2.jpg'],
+        '/photos/c.jpg': ['/photos/c1.jpg'],
+    }
@@ -0,0 +1,39 @@
+"""
+Tests for the near-duplicate hash index.
+"""
+import os
+import sys
+import random
+import numpy as np
+
+# Add the script directory to the path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'script')))
+
+import hash_index
+from hash_index import HammingIndex, popcount64
+
+def test_popcount64_matches_python(monkeypatch):
+    """Vectorized popcount agrees with int.bit_count, with and without np.bitwise_count."""
+    rng = random.Random(99)
+    values = [0, 1, (1 << 64) - 1] + [rng.getrandbits(64) for _ in range(100)]
+    expected = [bin(v).count('1') for v in values]
+    arr = np.array(values, dtype=np.uint64)
+    assert popcount64(arr).tolist() == expected
+    
+    monkeypatch.delattr(hash_index.np, 'bitwise_count', raising=False)
+    assert popcount64(arr).tolist() == expected
+
+def test_hamming_index_nearest():
+    """The closest hash within the radius is returned with its position."""
+    index = HammingIndex(capacity=1)
+    assert index.nearest(0, 64) is None
+    
+    base = 0x0123456789ABCDEF
+    assert index.add(base ^ 0b111) == 0
+    assert index.add(base ^ 0b1) == 1
+    assert index.add(~base & ((1 << 64) - 1)) == 2
+    assert len(index) == 3
+    
+    assert index.nearest(base, 2) == (1, 1)
+    assert index.nearest(base, 0) is None
+    assert index.distances(base).tolist() == [3, 1, 64]
@@ -0,0 +1,118 @@
+"""
+Tests for the image helper functions.
+"""
+import os
+import sys
+import pytest
+import numpy as np
+from PIL import Image
+
+# Add the script directory to the path so we can import our modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'script')))
+
+from image_utils import (
+    compare_image_quality, difference_hash, grayscale_thumbnail, load_comparison_image,
+    load_hash_thumbnail, load_thumbnail, perceptual_hash
+)
+
+def test_compare_identical_images():
+    """Identical images should have a similarity of 1.0."""
+    img = Image.new('RGB', (32, 32), (120, 60, 200))
+    assert compare_image_quality(img, img.copy()) == pytest.approx(1.0)
+
+def test_compare_opposite_images():
+    """Black versus white should have a similarity of 0.0."""
+    black = Image.new('RGB', (16, 16), (0, 0, 0))
+    white = Image.new('RGB', (16, 16), (255, 255, 255))
+    assert compare_image_quality(black, white) == pytest.approx(0.0)
+
+def test_compare_different_sizes_and_modes():
+    """Images are resized and converted before being compared."""
+    small = Image.new('L', (10, 10), 128)
+    large = Image.new('RGB', (40, 20), (128, 128, 128))
+    assert compare_image_quality(small, large) == pytest.approx(1.0)
+
+def test_compare_unrelated_images():
+    """Unrelated images score low, even when their colours and brightness are close."""
+    rng = np.random.default_rng(3)
+    smooth = [
+        Image.fromarray(rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)).resize(
+            (128, 128), Image.Resampling.BICUBIC)
+        for _ in range(2)
+    ]
+    y, x = np.mgrid[0:128, 0:128]
+    gradient = Image.fromarray((x * 2).astype(np.uint8))
+    rings = Image.fromarray((np.hypot(x - 64, y - 64) * 8 % 256).astype(np.uint8))
+    # A plain mean squared error rated both pairs above 0.8
+    assert compare_image_quality(*smooth) < 0.5
+    assert compare_image_quality(gradient, rings) < 0.5
+
+def test_compare_reencoded_copies(tmp_path):
+    """Heavily compressed and downscaled copies still score close to 1.0."""
+    rng = np.random.default_rng(3)
+    img = Image.fromarray(rng.integers(0, 256, (8, 8, 3), dtype=np.uint8)).resize(
+        (400, 300), Image.Resampling.BICUBIC)
+    img.save(tmp_path / 'low.jpg', quality=10)
+    assert compare_image_quality(img, Image.open(tmp_path / 'low.jpg')) > 0.95
+    assert compare_image_quality(img, img.resize((100, 75))) > 0.95
+
+def test_grayscale_thumbnail():
+    """Thumbnails are single-channel and of the requested size."""
+    img = Image.new('RGB', (640, 480), (255, 0, 0))
+    thumb = grayscale_thumbnail(img)
+    assert thumb.mode == 'L'
+    assert thumb.size == (32, 32)
+    assert grayscale_thumbnail(img, 16).size == (16, 16)
+
+def test_load_thumbnail_jpeg(tmp_path):
+    """Large JPEGs are scaled down to fit while keeping the aspect ratio."""
+    path = tmp_path / 'large.jpg'
+    Image.new('RGB', (2000, 1000), (10, 200, 30)).save(path)
+    thumb = load_thumbnail(str(path), (400, 300))
+    assert thumb.mode == 'RGB'
+    assert thumb.size == (400, 200)
+
+def test_load_thumbnail_transparent_png(tmp_path):
+    """Transparent areas are flattened onto white."""
+    path = tmp_path / 'alpha.png'
+    Image.new('RGBA', (50, 50), (0, 0, 0, 0)).save(path)
+    thumb = load_thumbnail(str(path), (100, 100))
+    assert thumb.size == (50, 50)
+    assert thumb.getpixel((0, 0)) == (255, 255, 255)
+
+def test_load_hash_thumbnail(tmp_path):
+    """Hash thumbnails are small grayscale images close to a full decode."""
+    path = tmp_path / 'photo.jpg'
+    img = Image.new('RGB', (1600, 1200), (30, 60, 90))
+    img.paste((250, 250, 250), (0, 0, 800, 1200))
+    img.save(path, quality=95)
+    
+    thumb = load_hash_thumbnail(str(path))
+    assert thumb.mode == 'L'
+    assert thumb.size == (32, 32)
+    assert compare_image_quality(thumb, grayscale_thumbnail(Image.open(path))) > 0.99
+
+def test_load_comparison_image(tmp_path):
+    """Comparison images have a fixed size, so any two can be compared directly."""
+    path = tmp_path / 'wide.png'
+    Image.new('P', (300, 100)).save(path)
+    img = load_comparison_image(str(path), 64)
+    assert img.mode == 'RGB'
+    assert img.size == (64, 64)
+
+def test_hashes_match_imagehash():
+    """The integer hashes have the same bits as imagehash, including flat images."""
+    imagehash = pytest.importorskip('imagehash')
+    rng = np.random.default_rng(7)
+    images = [Image.new('L', (32, 32), 128), Image.new('RGB', (300, 200), (200, 10, 10))]
+    images += [Image.fromarray(rng.integers(0, 256, (32, 32), dtype=np.uint8)) for _ in range(20)]
+    # Blocky images have DCT coefficients that are zero up to rounding
+    images += [
+        Image.fromarray(np.kron(rng.integers(0, 256, (4, 4), dtype=np.uint8),
+                                np.ones((8, 8), dtype=np.uint8)))
+        for _ in range(20)
+    ]
+    for img in images:
+        assert perceptual_hash(img) == int(str(imagehash.phash(img)), 16)
+        assert difference_hash(img) == int(str(imagehash.dhash(img)), 16)
+    assert perceptual_hash(images[2], 5) == int(str(imagehash.phash(images[2], 5)), 16)
@@ -0,0 +1,218 @@
+"""
+Tests for the image comparison worker.
+"""
+import os
+import sys
+import random
+import sqlite3
+import pytest
+import numpy as np
+from pathlib import Path
+from unittest.mock import MagicMock
+from PIL import Image
+
+# Add the project root to the path so the script package can be imported
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# The worker decodes images through ImageMagick, which may not be installed
+try:
+    import wand.image  # noqa: F401
+except ImportError as e:
+    pytest.skip(f"Wand/ImageMagick not available: {e}", allow_module_level=True)
+
+import script.workers
+from script.workers import DeleteWorker, ImageComparisonWorker, HashCache
+
+@pytest.fixture
+def image_tree(tmp_path):
+    """Create a small folder tree with image and non-image files."""
+    (tmp_path / 'sub' / 'deeper').mkdir(parents=True)
+    for name in ('a.jpg', 'B.PNG', 'notes.txt', 'sub/c.gif', 'sub/deeper/d.webp'):
+        (tmp_path / name).write_bytes(b'data')
+    return tmp_path
+
+@pytest.fixture
+def make_worker(tmp_path):
+    """Create workers whose hash cache lives in the temporary directory."""
+    workers = []
+    
+    def make(folder, **kwargs):
+        worker = ImageComparisonWorker(str(folder), hash_cache=HashCache(tmp_path / 'cache.db'), **kwargs)
+        workers.append(worker)
+        return worker
+    
+    yield make
+    for worker in workers:
+        worker.hash_cache.close()
+
+def test_get_image_files_recursive(image_tree, make_worker):
+    """Recursive scans find images in all subfolders, matching extensions case-insensitively."""
+    worker = make_worker(image_tree)
+    found = worker._get_image_files(str(image_tree))
+    names = sorted(os.path.relpath(path, image_tree) for path, _ in found)
+    assert names == sorted(['a.jpg', 'B.PNG', os.path.join('sub', 'c.gif'),
+                            os.path.join('sub', 'deeper', 'd.webp')])
+    assert all(stat.st_size == 4 for _, stat in found)
+
+def test_get_image_files_non_recursive(image_tree, make_worker):
+    """Non-recursive scans only look at the top folder."""
+    worker = make_worker(image_tree, recursive=False)
+    found = worker._get_image_files(str(image_tree))
+    assert sorted(os.path.basename(path) for path, _ in found) == ['B.PNG', 'a.jpg']
+
+def test_find_identical_files(tmp_path, make_worker):
+    """Only byte-identical files are reported, even when size and prefix match."""
+    prefix = b'x' * (128 * 1024)
+    contents = {
+        'a.jpg': prefix + b'tail-1',
+        'b.jpg': prefix + b'tail-1',
+        'c.jpg': prefix + b'tail-2',  # same size and prefix, different tail
+        'd.png': b'small',
+        'e.png': b'small',
+        'f.png': b'other',
+        'g.png': b'unique size',
+    }
+    for name, data in contents.items():
+        (tmp_path / name).write_bytes(data)
+    
+    worker = make_worker(tmp_path)
+    identical = worker._find_identical_files(worker._get_image_files(str(tmp_path)))
+    assert {os.path.basename(k): os.path.basename(v) for k, v in identical.items()} == {
+        'b.jpg': 'a.jpg',
+        'e.png': 'd.png',
+    }
+
+def test_progress_updates_are_coalesced(tmp_path, make_worker):
+    """Rapid progress updates are dropped, but forced ones always go through."""
+    worker = make_worker(tmp_path)
+    emitted = []
+    worker.signals.progress.connect(emitted.append)
+    
+    worker._emit_progress(10, force=True)
+    for progress in range(11, 95):
+        worker._emit_progress(progress)
+    worker._emit_progress(95, force=True)
+    worker._emit_progress(95, force=True)
+    
+    assert emitted[0] == 10
+    assert emitted[-1] == 95
+    assert len(emitted) < 10
+    assert emitted.count(95) == 1
+
+def test_group_similar(tmp_path, make_worker):
+    """Hashes within the radius share a group and identical hashes are never split."""
+    worker = make_worker(tmp_path, similarity_threshold=90)  # radius 3
+    base = 0x0123456789ABCDEF
+    hashes = {
+        'a.jpg': base,
+        'b.jpg': base ^ 0b111,  # 3 bits away
+        'c.jpg': base ^ 0xFFFF,  # 16 bits away
+        'd.jpg': base ^ 0xFFFF,
+        'e.jpg': base,
+    }
+    assert worker._group_similar(hashes) == [['a.jpg', 'b.jpg', 'e.jpg'], ['c.jpg', 'd.jpg']]
+
+def test_unrelated_hashes_are_not_grouped(make_worker, tmp_path):
+    """At the lowest threshold, thousands of unrelated images still stay apart."""
+    worker = make_worker(tmp_path, similarity_threshold=70)
+    assert worker._max_hash_distance() == 10
+    assert make_worker(tmp_path, similarity_threshold=100)._max_hash_distance() == 0
+    
+    # Any pair among 2000 random hashes is at least 14 bits apart, but a linear
+    # mapping onto all 64 bits (19 bits at 70%) would put about 800 of them in groups
+    rng = random.Random(7)
+    hashes = {f'{i}.jpg': rng.getrandbits(64) for i in range(2000)}
+    assert all(len(group) == 1 for group in worker._group_similar(hashes))
+
+def test_hash_cache_refreshes_hits(tmp_path):
+    """Entries are keyed on mtime and size, and reading one keeps it from expiring."""
+    image = tmp_path / 'a.jpg'
+    image.write_bytes(b'data')
+    cache = HashCache(tmp_path / 'cache.db')
+    cache.set(str(image), 'ff' * 8, '00' * 8)
+    cache._conn.execute("UPDATE hashes SET timestamp = 0")
+    
+    assert cache.get(str(image)) == {'phash': 'ff' * 8, 'dhash': '00' * 8}
+    cache.save()
+    cache.cleanup()
+    assert cache.get(str(image)) is not None
+    
+    image.write_bytes(b'changed')
+    assert cache.get(str(image)) is None
+    cache.close()
+
+def test_hash_cache_commits_in_batches(tmp_path, monkeypatch):
+    """New entries reach the database every few writes, without waiting for save()."""
+    monkeypatch.setattr(script.workers, 'CACHE_COMMIT_INTERVAL', 2)
+    cache = HashCache(tmp_path / 'cache.db')
+    reader = sqlite3.connect(str(tmp_path / 'cache.db'))
+    count = lambda: reader.execute("SELECT COUNT(*) FROM hashes").fetchone()[0]
+    
+    for name in ('a.jpg', 'b.jpg', 'c.jpg'):
+        (tmp_path / name).write_bytes(b'data')
+        cache.set(str(tmp_path / name), 'ff' * 8, '00' * 8)
+    assert count() == 2
+    cache.save()
+    assert count() == 3
+    reader.close()
+    cache.close()
+
+def test_decompression_bombs_are_not_decoded_with_wand(tmp_path, monkeypatch, make_worker):
+    """Images Pillow refuses as too large are skipped instead of decoded by Wand."""
+    Image.new('L', (100, 100)).save(tmp_path / 'big.png')
+    monkeypatch.setattr(Image, 'MAX_IMAGE_PIXELS', 1000)
+    worker = make_worker(tmp_path)
+    monkeypatch.setattr(worker, '_load_pil_image', lambda *args, **kwargs: pytest.fail('decoded with Wand'))
+    assert worker._get_image_hashes(str(tmp_path / 'big.png')) is None
+
+def test_quality_score_reads_only_the_header(tmp_path, monkeypatch, make_worker):
+    """The resolution comes from the file header; Wand is not used for images Pillow opens."""
+    path = tmp_path / 'wide.png'
+    Image.new('RGB', (30, 20)).save(path)
+    monkeypatch.setattr(script.workers, 'WandImage', None)
+    worker = make_worker(tmp_path)
+    assert worker._get_image_quality_score(str(path)) == (600, path.stat().st_size)
+
+def test_unrelated_images_are_not_similar(tmp_path, make_worker):
+    """The pixel check rejects unrelated images even at the lowest threshold."""
+    rng = np.random.default_rng(4)
+    for name in ('a.png', 'b.png'):
+        Image.fromarray(rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)).resize(
+            (200, 150), Image.Resampling.BICUBIC).save(tmp_path / name)
+    worker = make_worker(tmp_path, similarity_threshold=70)
+    assert not worker._is_similar(str(tmp_path / 'a.png'), str(tmp_path / 'b.png'))
+    assert worker._is_similar(str(tmp_path / 'a.png'), str(tmp_path / 'a.png'))
+
+def test_delete_worker_reports_failures():
+    """Files that cannot be trashed are reported as failed without stopping the batch."""
+    paths = [f'/photos/{name}.jpg' for name in 'abcd']
+    
+    def move_to_trash(path):
+        if path.endswith('b.jpg'):
+            raise OSError('locked')
+    
+    undo_manager = MagicMock()
+    undo_manager.move_to_trash.side_effect = move_to_trash
+    worker = DeleteWorker(paths, undo_manager)
+    progress, finished = [], []
+    worker.signals.progress.connect(progress.append)
+    worker.signals.finished.connect(lambda deleted, failed: finished.append((deleted, failed)))
+    
+    worker.run()
+    
+    assert [call.args[0] for call in undo_manager.move_to_trash.call_args_list] == paths
+    assert finished == [(['/photos/a.jpg', '/photos/c.jpg', '/photos/d.jpg'], ['/photos/b.jpg'])]
+    assert progress[-1] == len(paths)
+
+def test_delete_worker_stops_early():
+    """A stop request leaves the remaining files alone and still reports what was done."""
+    undo_manager = MagicMock()
+    worker = DeleteWorker(['/photos/a.jpg', '/photos/b.jpg'], undo_manager)
+    undo_manager.move_to_trash.side_effect = lambda path: worker.stop()
+    finished = []
+    worker.signals.finished.connect(lambda deleted, failed: finished.append((deleted, failed)))
+    
+    worker.run()
+    
+    assert undo_manager.move_to_trash.call_count == 1
+    assert finished == [(['/photos/a.jpg'], [])]